@@ -1,6 +1,6 @@
 "use client"
 
-import { useCallback, useMemo, useState } from "react"
+import { useCallback, useEffect, useMemo, useState } from "react"
 
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { Badge } from "@/components/ui/badge"
@@ -49,27 +49,101 @@ function extractBoundary(contentType: string | null): string {
   return match?.[1]?.trim() ?? "longform-scenes-boundary"
 }
 
-function parseMultipartMetadata(buffer: ArrayBuffer, boundary: string): LongformScenesResult {
+interface MultipartPart {
+  headers: Record<string, string>
+  body: ArrayBuffer
+}
+
+function indexOfBytes(haystack: Uint8Array, needle: Uint8Array, start: number): number {
+  outer: for (let i = start; i <= haystack.length - needle.length; i++) {
+    for (let j = 0; j < needle.length; j++) {
+      if (haystack[i + j] !== needle[j]) {
+        continue outer
+      }
+    }
+    return i
+  }
+  return -1
+}
+
+function splitMultipart(buffer: ArrayBuffer, boundary: string): MultipartPart[] {
+  const bytes = new Uint8Array(buffer)
+  const encoder = new TextEncoder()
   const decoder = new TextDecoder("utf-8")
-  const text = decoder.decode(buffer)
-  const boundaryToken = `--${boundary}`
-  const rawParts = text
-    .split(boundaryToken)
-    .map((part) => part.trim())
-    .filter((part) => part.length > 0 && part !== "--")
-
-  const jsonPart = rawParts.find((part) => part.includes("Content-Type: application/json"))
+  const delimiter = encoder.encode(`--${boundary}`)
+  const headerEnd = encoder.encode("\r\n\r\n")
+  const parts: MultipartPart[] = []
+
+  let cursor = indexOfBytes(bytes, delimiter, 0)
+  while (cursor !== -1) {
+    const partStart = cursor + delimiter.length
+    // The closing delimiter is followed by "--".
+    if (bytes[partStart] === 0x2d && bytes[partStart + 1] === 0x2d) {
+      break
+    }
+    const next = indexOfBytes(bytes, delimiter, partStart)
+    if (next === -1) {
+      break
+    }
+
+    const headersStart = partStart + 2
+    const separator = indexOfBytes(bytes, headerEnd, headersStart)
+    if (separator !== -1 && separator < next) {
+      const headers: Record<string, string> = {}
+      for (const line of decoder.decode(bytes.subarray(headersStart, separator)).split("\r\n")) {
+        const colon = line.indexOf(":")
+        if (colon > 0) {
+          headers[line.slice(0, colon).trim().toLowerCase()] = line.slice(colon + 1).trim()
+        }
+      }
+      // Each part body ends with the CRLF that precedes the next delimiter.
+      parts.push({ headers, body: buffer.slice(separator + headerEnd.length, next - 2) })
+    }
+    cursor = next
+  }
+
+  return parts
+}
+
+function parseMultipartResponse(buffer: ArrayBuffer, boundary: string): LongformScenesResult {
+  const parts = splitMultipart(buffer, boundary)
+
+  const jsonPart = parts.find((part) => part.headers["content-type"]?.startsWith("application/json"))
   if (!jsonPart) {
     throw new Error("Missing JSON metadata in multipart response")
   }
 
-  const [, body = ""] = jsonPart.split("\r\n\r\n")
-  const cleaned = body.replace(/--$/, "").trim()
+  const cleaned = new TextDecoder("utf-8").decode(jsonPart.body).trim()
   if (!cleaned) {
     throw new Error("JSON metadata section was empty")
   }
+  const metadata = JSON.parse(cleaned) as LongformScenesResult
 
-  return JSON.parse(cleaned) as LongformScenesResult
+  const audioUrls = new Map<string, string>()
+  for (const part of parts) {
+    const contentId = part.headers["content-id"]?.replace(/^<|>$/g, "")
+    if (contentId) {
+      const blob = new Blob([part.body], { type: part.headers["content-type"] ?? "audio/mpeg" })
+      audioUrls.set(`cid:${contentId}`, URL.createObjectURL(blob))
+    }
+  }
+  const resolve = (path: string) => audioUrls.get(path) ?? path
+
+  return {
+    scenes: metadata.scenes.map((scene) => ({
+      ...scene,
+      processed_audio_path: resolve(scene.processed_audio_path),
+    })),
+    final_audio_path: resolve(metadata.final_audio_path),
+  }
+}
+
+function revokeAudioUrls(result: LongformScenesResult) {
+  for (const path of [result.final_audio_path, ...result.scenes.map((scene) => scene.processed_audio_path)]) {
+    if (path.startsWith("blob:")) {
+      URL.revokeObjectURL(path)
+    }
+  }
 }
 
 export default function LongformScenesTester() {
@@ -78,6 +152,14 @@ export default function LongformScenesTester() {
   const [error, setError] = useState("")
   const [result, setResult] = useState<LongformScenesResult | null>(null)
 
+  useEffect(() => {
+    return () => {
+      if (result) {
+        revokeAudioUrls(result)
+      }
+    }
+  }, [result])
+
   const sceneCount = useMemo(() => result?.scenes.length ?? 0, [result])
   const sentenceCount = useMemo(
     () => result?.scenes.reduce((total, scene) => total + scene.segments.length, 0) ?? 0,
@@ -119,8 +201,7 @@ export default function LongformScenesTester() {
 
       const boundary = extractBoundary(response.headers.get("content-type"))
       const buffer = await response.arrayBuffer()
-      const metadata = parseMultipartMetadata(buffer, boundary)
-      setResult(metadata)
+      setResult(parseMultipartResponse(buffer, boundary))
     } catch (err) {
       const message = err instanceof Error ? err.message : "Unexpected error while generating audio"
       setError(message)
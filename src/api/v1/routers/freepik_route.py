@@ -158,4 +158,4 @@ async def retrieve_kling_video_status(
         task_id,
         asset_index,
     )
-    return _stream_generated_video(task_id, str(generated_assets[asset_index]))
+    return _stream_generated_video(task_id, generated_assets[asset_index])
@@ -14,12 +14,14 @@ from config.config import settings
 from controllers.generate_video import upload_audio_assets
 from models.heygen import (
     HeyGenAvatarAgentOutput,
+    HeyGenAvatarJob,
+    HeyGenAvatarRequestPayload,
     HeyGenAvatarVideoRequest,
     HeyGenAvatarVideoResponse,
     HeyGenVideoRequest,
     HeyGenVideoResponse,
 )
-from utils.agents import heygen_avatar_agent
+from utils import agents
 
 router = APIRouter()
 
@@ -128,7 +130,7 @@ async def generate_avatar_iv_video(
     )
 
     try:
-        agent_output_raw = await heygen_avatar_agent.run(envelope)
+        agent_output_raw = await agents.heygen_avatar_agent.run(envelope)
         prompts = HeyGenAvatarAgentOutput.model_validate_json(agent_output_raw.output)
     except (ValidationError, json.JSONDecodeError) as validation_error:
         logger.warning("HeyGen avatar agent output invalid: %s", validation_error)
@@ -165,13 +167,13 @@ async def generate_avatar_iv_video(
             http_error.status_code,
             http_error.detail,
         )
-        return HeyGenAvatarVideoResponse(
+        return HeyGenAvatarVideoResponse.model_construct(
             status="failed",
-            job={},
+            job=HeyGenAvatarJob(),
             prompts=prompts,
             audio_asset_id=resolved_audio_asset_id,
             audio_reference=resolved_audio_alias,
-            request_payload=payload,
+            request_payload=HeyGenAvatarRequestPayload.model_validate(payload),
             errors=[str(http_error.detail)],
         )
 
@@ -180,12 +182,12 @@ async def generate_avatar_iv_video(
         (job.get("data") or {}).get("video_id"),
         resolved_audio_asset_id,
     )
-    return HeyGenAvatarVideoResponse(
+    return HeyGenAvatarVideoResponse.model_construct(
         status="success",
-        job=job,
+        job=HeyGenAvatarJob.model_validate(job),
         prompts=prompts,
         audio_asset_id=resolved_audio_asset_id,
         audio_reference=resolved_audio_alias,
-        request_payload=payload,
+        request_payload=HeyGenAvatarRequestPayload.model_validate(payload),
         errors=[],
     )
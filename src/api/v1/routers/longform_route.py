@@ -28,9 +28,9 @@ async def generate_longform_scenes(
     if not request.script or not request.script.strip():
         raise HTTPException(status_code=422, detail="Script must not be empty.")
 
-    metadata, final_audio = await process_longform_script(request.script)
+    metadata, final_audio, scene_audio = await process_longform_script(request.script)
 
     return StreamingResponse(
-        build_multipart_response(metadata, final_audio),
+        build_multipart_response(metadata, final_audio, scene_audio),
         media_type=multipart_media_type(),
     )
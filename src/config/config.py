@@ -10,6 +10,13 @@ class Settings(BaseSettings):
     GROQ_API_KEY: str = Field(default="")
     ELEVENLABS_API_KEY: str = Field(default="")
     ELEVENLABS_URL: str = Field(default="https://api.elevenlabs.io/v1/text-to-dialogue")
+    ELEVENLABS_PCM_FORMAT: str = Field(default="pcm_44100", pattern=r"^pcm_\d+$")
+    MAX_ELEVENLABS_CONCURRENCY: int = Field(default=6, ge=1)
+    MAX_WHISPER_CONCURRENCY: int = Field(default=4, ge=1)
+    WHISPER_CACHE_DIR: str = Field(default="")
+    WHISPER_CACHE_MAX_ENTRIES: int = Field(default=2048, ge=1)
+    ELEVENLABS_BATCH_MAX_CHARACTERS: int = Field(default=3000, ge=1)
+    LONGFORM_SILENCE_DETECT_MIN_MS: int = Field(default=15000, ge=0)
     HEYGEN_API_KEY: str = Field(default="")
     HEYGEN_DEFAULT_TALKING_PHOTO_ID: str = Field(default="Monica_inSleeveless_20220819")
     FREEPIK_API_KEY: str = Field(default="")
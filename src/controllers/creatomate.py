@@ -25,7 +25,7 @@ from models.creatomate import (
     SceneVideoAsset,
 )
 from models.heygen import HeyGenVideoResult
-from utils.agents import creatomate_agent
+from utils import agents
 
 logger = logging.getLogger(__name__)
 
@@ -365,7 +365,7 @@ async def orchestrate_creatomate_render(
     )
 
     try:
-        agent_response = await creatomate_agent.run(agent_brief)
+        agent_response = await agents.creatomate_agent.run(agent_brief)
         agent_output = CreatomateAgentOutput.model_validate_json(agent_response.output)
     except (ValidationError, json.JSONDecodeError) as exc:
         logger.warning("Creatomate agent validation failed: %s", exc)
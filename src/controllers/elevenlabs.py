@@ -29,12 +29,7 @@ from models.elevenlabs_model import (
     SanitizedSceneCollection,
     ScriptRequest,
 )
-from utils.agents import (
-    audio_agent,
-    longform_audio_agent,
-    longform_sanitizer_agent,
-    longform_splice_agent,
-)
+from utils import agents
 
 OUTPUT_DIR = Path("generated_audio")
 AUDIO_MANIFEST_PATH = OUTPUT_DIR / "scene_audio_map.json"
@@ -222,7 +217,9 @@ async def _run_sanitizer_agent(plan: LongFormAudioPlan) -> dict[str, SanitizedSc
     }
 
     try:
-        response = await longform_sanitizer_agent.run(json.dumps(payload, ensure_ascii=False))
+        response = await agents.longform_sanitizer_agent.run(
+            json.dumps(payload, ensure_ascii=False)
+        )
     except Exception as exc:  # pragma: no cover - external service
         logger.warning("Sanitizer agent failed: %s", exc)
         return {}
@@ -276,7 +273,7 @@ async def _run_splice_agent(
         }
 
     try:
-        response = await longform_splice_agent.run(json.dumps(payload, ensure_ascii=False))
+        response = await agents.longform_splice_agent.run(json.dumps(payload, ensure_ascii=False))
     except Exception as exc:  # pragma: no cover - external service
         logger.warning("Splice agent failed for %s: %s", segment_id, exc)
         return {}
@@ -490,7 +487,7 @@ async def synthesize_audio_assets(script: str) -> tuple[ScriptRequest, dict[str,
     """Generate audio assets for a script and return the structured plan plus output metadata."""
 
     logger.info("Starting ElevenLabs scene audio synthesis (script_length=%d)", len(script or ""))
-    agent_response = await audio_agent.run(script)
+    agent_response = await agents.audio_agent.run(script)
     try:
         agent_payload = json.loads(agent_response.output)
         script_config = ScriptRequest.model_validate(agent_payload)
@@ -624,7 +621,7 @@ async def synthesize_longform_audio(request: LongFormAudioRequest) -> dict[str,
                 f"{agent_input}"
             )
 
-    agent_response = await longform_audio_agent.run(agent_input)
+    agent_response = await agents.longform_audio_agent.run(agent_input)
     try:
         agent_payload = json.loads(agent_response.output)
         plan = LongFormAudioPlan.model_validate(agent_payload)
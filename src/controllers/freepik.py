@@ -22,7 +22,7 @@ from models.freepik_model import (
     FreepikImageToVideoResponse,
     FreepikPromptBundle,
 )
-from utils.agents import freepik_agent
+from utils import agents
 
 FREEPIK_IMAGE_TO_VIDEO_URL = "https://api.freepik.com/v1/ai/image-to-video/kling-v2-1-std"
 FREEPIK_STATUS_URL = "https://api.freepik.com/v1/ai/image-to-video/kling-v2-1"
@@ -64,7 +64,7 @@ async def generate_prompt_bundle(
     """Use the Freepik agent to craft prompts with a resilient fallback."""
 
     try:
-        agent_response = await freepik_agent.run(
+        agent_response = await agents.freepik_agent.run(
             json.dumps(
                 {
                     "script": request.script,
@@ -22,7 +22,7 @@ from models.heygen import (
     HeyGenVideoResponse,
     HeyGenVideoResult,
 )
-from utils.agents import heygen_agent
+from utils import agents
 
 logger = logging.getLogger(__name__)
 
@@ -470,7 +470,7 @@ async def generate_video_batch(
     agent_input = _prepare_agent_input(script, resolved_assets)
 
     try:
-        agent_output_raw = await heygen_agent.run(agent_input)
+        agent_output_raw = await agents.heygen_agent.run(agent_input)
         structured = HeyGenStructuredOutput.model_validate_json(agent_output_raw.output)
     except ValidationError as error:
         logger.warning("HeyGen agent validation failed: %s", error)
@@ -620,7 +620,8 @@ async def generate_video_batch(
         len(errors),
     )
 
-    return HeyGenVideoResponse(
+    # Every field was assembled above from already-validated results.
+    return HeyGenVideoResponse.model_construct(
         status=status,
         results=results,
         missing_assets=missing_assets,
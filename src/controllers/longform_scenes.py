@@ -2,44 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
-import json
 import logging
 import math
 import re
-from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import Any, cast
-
-import requests
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any, cast
+
+import httpx
+import numpy as np
+import orjson
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydub import AudioSegment
-from pydub.silence import detect_silence
+from pydub.utils import db_to_float
 
 from config.config import settings
-from models.elevenlabs_model import LongFormAudioPlan, PauseAdjustmentResponse
+from models.elevenlabs_model import LongFormAudioPlan, LongFormSegment, PauseAdjustmentResponse
 from models.longform import (
     LongformScenesResponse,
     SceneProcessingSummary,
     SceneTimingAnalysis,
     SegmentPausePlan,
 )
-from utils.agents import (
-    longform_audio_agent,
-    longform_clause_agent,
-    longform_splice_agent,
-)
+from utils import agents
 from utils.audio_analysis import analyze_scene_audio
 
 logger = logging.getLogger(__name__)
 
+_elevenlabs_semaphore = asyncio.Semaphore(settings.MAX_ELEVENLABS_CONCURRENCY)
+_elevenlabs_client: httpx.AsyncClient | None = None
+# Serializes the multipart metadata straight to UTF-8 bytes, skipping the str round trip.
+_LONGFORM_RESPONSE_ADAPTER = TypeAdapter(LongformScenesResponse)
+
 DEFAULT_PAUSE_SECONDS = 1.5
 SENTENCE_ENDINGS = {".", "?", "!", "।"}
 SPLIT_SILENCE_MAX_OFFSET_MS = 1200
-PAUSE_LABEL_PATTERN = r"(?:sec(?:onds?)?|secs?|s)"
+
+
+def _ascii_case_insensitive(word: str) -> str:
+    """Spell ``word`` as per-letter ``[xX]`` classes.
+
+    The compiled patterns then match plain literals and classes instead of taking the
+    slower case-folding path ``re.IGNORECASE`` uses for every character scanned.
+    """
+
+    return "".join(f"[{letter.lower()}{letter.upper()}]" for letter in word)
+
+
+PAUSE_LABEL_PATTERN = (
+    f"(?:{_ascii_case_insensitive('sec')}(?:{_ascii_case_insensitive('ond')}[sS]?)?"
+    f"|{_ascii_case_insensitive('sec')}[sS]?|[sS])"
+)
 PAUSE_ANNOTATION_PATTERN = (
     r"\*?\(?\s*(?:(?P<pause>\d+(?:\.\d+)?)\s*"
     + PAUSE_LABEL_PATTERN
@@ -48,30 +67,77 @@ PAUSE_ANNOTATION_PATTERN = (
     + r"\s*(?P<pause_alt>\d+(?:\.\d+)?))\s*\)?\*?"
 )
 
-EXPLICIT_PAUSE_PATTERN = re.compile(PAUSE_ANNOTATION_PATTERN, re.IGNORECASE)
-SENTENCE_PATTERN = re.compile(
-    r"(?P<sentence>.+?[\.\?!।])\s*(?:" + PAUSE_ANNOTATION_PATTERN + r")?",
-    re.IGNORECASE | re.DOTALL,
+EXPLICIT_PAUSE_PATTERN = re.compile(PAUSE_ANNOTATION_PATTERN)
+INLINE_PAUSE_LABEL_PATTERN = re.compile(
+    r"\b("
+    + "|".join(_ascii_case_insensitive(label) for label in ("sec", "secs", "second", "seconds"))
+    + r")\b"
 )
-
-MARKUP_NORMALIZATION_PATTERN = re.compile(r"[\s\*_`~\u200b\u200c\u200d]+", re.UNICODE)
+SENTENCE_END_PATTERN = re.compile("[" + re.escape("".join(SENTENCE_ENDINGS)) + "]")
+
+# Every character ``str.isspace`` (and therefore regex ``\s``) accepts, plus markup and
+# zero-width joiners, deleted in one ``str.translate`` walk.
+MARKUP_NORMALIZATION_TABLE = str.maketrans(
+    "",
+    "",
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+    "*_`~\u200b\u200c\u200d",
+)
+# ElevenLabs audio tags (``[calm]``) and SSML (``<break time="1.5s"/>``) the audio agent
+# adds to synthesized text; they are not spoken, so alignment matching ignores them.
+AUDIO_MARKUP_PATTERN = re.compile(r"\[[^\[\]]*\]|<[^<>]*>")
 MULTIPART_BOUNDARY = "longform-scenes-boundary"
+FINAL_AUDIO_CONTENT_ID = "final"
 
 
 @dataclass(slots=True)
 class SceneBlock:
     name: str
-    lines: list[str]
+    lines: tuple[str, ...]
+    raw_text: str
 
-    @property
-    def raw_text(self) -> str:
-        return " ".join(line.strip() for line in self.lines if line.strip()).strip()
+
+@dataclass(slots=True)
+class SceneAlignment:
+    """Per-character timings ElevenLabs reported for the synthesized scene text."""
+
+    characters: list[str] = field(default_factory=list)
+    start_times_ms: list[int] = field(default_factory=list)
+    end_times_ms: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SceneAudioJob:
+    scene: SceneBlock
+    scene_text: str
+    fallback_plan: list[SegmentPausePlan]
+    audio_file: IO[bytes]
+    audio_size: int
+    alignment: SceneAlignment | None = None
 
 
 class SceneSegmentationPlan(BaseModel):
     segments: list[SegmentPausePlan]
 
 
+class SceneBatchEntry(BaseModel):
+    scene_name: str
+    scene_text: str
+    fallback_segments: list[SegmentPausePlan]
+    audio_metadata: dict[str, int]
+
+
+class SceneBatchRequest(BaseModel):
+    mode: str = "scene_batch"
+    scenes: list[SceneBatchEntry]
+
+
+class SceneBatchResponse(BaseModel):
+    plans: dict[str, Any]
+
+
 def _serialize_segments_for_agent(segments: list[SegmentPausePlan]) -> list[dict[str, Any]]:
     return [segment.model_dump() for segment in segments]
 
@@ -79,8 +145,8 @@ def _serialize_segments_for_agent(segments: list[SegmentPausePlan]) -> list[dict
 def _parse_clause_agent_segments(raw_output: object) -> list[SegmentPausePlan]:
     if isinstance(raw_output, str):
         try:
-            payload = json.loads(raw_output)
-        except json.JSONDecodeError as error:
+            payload = orjson.loads(raw_output)
+        except orjson.JSONDecodeError as error:
             logger.warning("Clause agent output was not valid JSON: %s", error)
             return []
     else:
@@ -111,14 +177,25 @@ def _plan_debug_snapshot(plan: list[SegmentPausePlan], limit: int = 80) -> list[
 
 def _normalized_scene_text(segments: list[SegmentPausePlan]) -> str:
     combined = "".join(segment.text.strip() for segment in segments if segment.text)
-    return MARKUP_NORMALIZATION_PATTERN.sub("", combined)
+    return combined.translate(MARKUP_NORMALIZATION_TABLE)
 
 
 AUDIO_FORMAT = "mp3"
 ELEVENLABS_TIMEOUT_SECONDS = 240
+ALIGNMENT_RESTART_TOLERANCE_MS = 50
+SCENE_AUDIO_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 SPLICE_AGENT_MAX_AUDIO_BYTES = 800_000
 PAUSE_DEVIATION_THRESHOLD = 0.2
 PAUSE_UPDATE_EPSILON = 1e-3
+PCM_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+# ElevenLabs ``pcm_<rate>`` output is headerless signed 16-bit little-endian mono.
+ELEVENLABS_PCM_SAMPLE_WIDTH = 2
+ELEVENLABS_PCM_CHANNELS = 1
+ELEVENLABS_PCM_FRAME_RATE = int(settings.ELEVENLABS_PCM_FORMAT.removeprefix("pcm_"))
+ELEVENLABS_PCM_BYTES_PER_SECOND = (
+    ELEVENLABS_PCM_FRAME_RATE * ELEVENLABS_PCM_SAMPLE_WIDTH * ELEVENLABS_PCM_CHANNELS
+)
+TRAILING_SILENCE_CHUNK_MS = 10
 
 
 def _is_scene_header(line: str) -> bool:
@@ -130,6 +207,11 @@ def _is_scene_header(line: str) -> bool:
     return stripped[-1] not in SENTENCE_ENDINGS
 
 
+def _scene_block(name: str, lines: list[str]) -> SceneBlock:
+    # ``_parse_script`` only collects stripped, non-empty lines, so a plain join suffices.
+    return SceneBlock(name=name, lines=tuple(lines), raw_text=" ".join(lines))
+
+
 def _parse_script(script: str) -> list[SceneBlock]:
     scenes: list[SceneBlock] = []
     current_name: str | None = None
@@ -143,7 +225,7 @@ def _parse_script(script: str) -> list[SceneBlock]:
 
         if _is_scene_header(line):
             if current_name and current_lines:
-                scenes.append(SceneBlock(name=current_name, lines=current_lines.copy()))
+                scenes.append(_scene_block(current_name, current_lines))
             current_name = line
             current_lines = []
         else:
@@ -153,7 +235,7 @@ def _parse_script(script: str) -> list[SceneBlock]:
             current_lines.append(line)
 
     if current_name and current_lines:
-        scenes.append(SceneBlock(name=current_name, lines=current_lines.copy()))
+        scenes.append(_scene_block(current_name, current_lines))
 
     if not scenes:
         raise HTTPException(status_code=422, detail="Unable to identify any scenes in the script.")
@@ -166,26 +248,79 @@ def _remove_pause_markers(text: str) -> str:
 
 
 def _strip_inline_pause_labels(text: str) -> str:
-    tokens = [
-        "sec",
-        "secs",
-        "second",
-        "seconds",
-    ]
-    pattern = re.compile(r"\b(" + "|".join(tokens) + r")\b", re.IGNORECASE)
-    return pattern.sub("", text)
+    return INLINE_PAUSE_LABEL_PATTERN.sub("", text)
+
+
+def _iter_sentences(text: str) -> Iterator[tuple[int, int, int, str | None]]:
+    """Split text into sentences in one forward scan.
+
+    Yields ``(sentence_start, sentence_end, consumed_end, pause_value)``: a sentence runs
+    to the first ending character after its first character, and any whitespace plus a
+    directly following pause annotation is consumed with it.
+    """
+
+    position = 0
+    length = len(text)
+    while position < length:
+        ending = SENTENCE_END_PATTERN.search(text, position + 1)
+        if ending is None:
+            return
+
+        sentence_end = ending.end()
+        consumed_end = sentence_end
+        while consumed_end < length and text[consumed_end].isspace():
+            consumed_end += 1
+
+        pause_value: str | None = None
+        pause_match = EXPLICIT_PAUSE_PATTERN.match(text, consumed_end)
+        if pause_match:
+            pause_value = pause_match.group("pause") or pause_match.group("pause_alt")
+            consumed_end = pause_match.end()
+
+        yield position, sentence_end, consumed_end, pause_value
+        position = consumed_end
 
 
 def _fallback_sentence_plan(scene_text: str) -> list[SegmentPausePlan]:
     segments: list[SegmentPausePlan] = []
     last_end = 0
 
-    for match in SENTENCE_PATTERN.finditer(scene_text):
-        sentence = match.group("sentence").strip()
-        pause_value = match.group("pause") or match.group("pause_alt")
-
-        # First, completely remove ALL pause markers from the sentence text
-        cleaned_sentence = EXPLICIT_PAUSE_PATTERN.sub("", sentence).strip()
+    # Locate every pause marker once; sentence text is then cleaned by slicing around
+    # the marker spans that fall inside it rather than re-running the pattern per sentence.
+    marker_spans = [marker.span() for marker in EXPLICIT_PAUSE_PATTERN.finditer(scene_text)]
+    marker_index = 0
+
+    for sentence_start, sentence_end, consumed_end, pause_value in _iter_sentences(scene_text):
+        straddles_boundary = False
+        while marker_index < len(marker_spans) and marker_spans[marker_index][0] < sentence_start:
+            if marker_spans[marker_index][1] > sentence_start:
+                straddles_boundary = True
+            marker_index += 1
+
+        pieces: list[str] = []
+        cursor = sentence_start
+        while marker_index < len(marker_spans) and marker_spans[marker_index][0] < sentence_end:
+            marker_start, marker_end = marker_spans[marker_index]
+            if marker_end > sentence_end:
+                straddles_boundary = True
+                break
+            pieces.append(scene_text[cursor:marker_start])
+            cursor = marker_end
+            marker_index += 1
+        pieces.append(scene_text[cursor:sentence_end])
+
+        if straddles_boundary:
+            # A marker crosses the sentence edge (e.g. "2.5 sec" split at "2."), so the
+            # global spans are out of step; clean this sentence on its own and rescan.
+            sentence = scene_text[sentence_start:sentence_end].strip()
+            cleaned_sentence = EXPLICIT_PAUSE_PATTERN.sub("", sentence).strip()
+            marker_spans = [
+                marker.span()
+                for marker in EXPLICIT_PAUSE_PATTERN.finditer(scene_text, consumed_end)
+            ]
+            marker_index = 0
+        else:
+            cleaned_sentence = "".join(pieces).strip()
 
         # Then determine the pause duration
         pause_seconds = float(pause_value) if pause_value is not None else 0.0
@@ -196,7 +331,7 @@ def _fallback_sentence_plan(scene_text: str) -> list[SegmentPausePlan]:
             segments.append(
                 SegmentPausePlan(text=cleaned_sentence, pause_after_seconds=pause_seconds)
             )
-        last_end = match.end()
+        last_end = consumed_end
 
     remainder = scene_text[last_end:].strip()
     if remainder:
@@ -221,7 +356,9 @@ def _fallback_sentence_plan(scene_text: str) -> list[SegmentPausePlan]:
         elif pause_seconds > 0.0:
             # If remainder was only a pause marker, apply it to the last segment
             if segments:
-                segments[-1].pause_after_seconds = pause_seconds
+                segments[-1] = segments[-1].model_copy(
+                    update={"pause_after_seconds": pause_seconds}
+                )
 
     if not segments:
         raise HTTPException(status_code=422, detail="No sentences detected within scene text.")
@@ -232,7 +369,7 @@ def _fallback_sentence_plan(scene_text: str) -> list[SegmentPausePlan]:
 async def _derive_segment_plan(
     scene_name: str,
     scene_text: str,
-    audio_bytes: bytes,
+    audio_size: int,
     fallback_plan: list[SegmentPausePlan],
 ) -> list[SegmentPausePlan]:
     if not settings.OPENAI_API_KEY:
@@ -250,14 +387,12 @@ async def _derive_segment_plan(
         "scene_text": scene_text,
         "fallback_segments": _serialize_segments_for_agent(fallback_plan),
         "audio_metadata": {
-            "byte_length": len(audio_bytes),
+            "byte_length": audio_size,
         },
     }
 
     try:
-        agent_result = await longform_clause_agent.run(
-            json.dumps(clause_payload, ensure_ascii=False)
-        )
+        agent_result = await agents.longform_clause_agent.run(orjson.dumps(clause_payload).decode())
     except Exception as error:  # pragma: no cover - external service
         logger.warning("Clause segmentation agent failed for '%s': %s", scene_name, error)
         return fallback_plan
@@ -272,6 +407,98 @@ async def _derive_segment_plan(
     return _validate_agent_plan(fallback_plan, agent_segments, scene_name)
 
 
+def _parse_clause_agent_batch(raw_output: object) -> dict[str, Any]:
+    if isinstance(raw_output, str):
+        try:
+            payload = orjson.loads(raw_output)
+        except orjson.JSONDecodeError as error:
+            logger.warning("Batched clause agent output was not valid JSON: %s", error)
+            return {}
+    else:
+        payload = raw_output
+
+    try:
+        response = SceneBatchResponse.model_validate(payload)
+    except ValidationError as error:
+        logger.warning("Batched clause agent payload failed validation: %s", error)
+        return {}
+
+    return response.plans
+
+
+async def _derive_segment_plans_batched(jobs: list[SceneAudioJob]) -> list[list[SegmentPausePlan]]:
+    """Segment every scene with a single clause agent request.
+
+    Scenes whose entry is missing or invalid in the batched response fall back to an
+    individual ``_derive_segment_plan`` call.
+    """
+
+    if not settings.OPENAI_API_KEY:
+        logger.debug("OPENAI_API_KEY missing; returning fallback segmentation for all scenes")
+        return [job.fallback_plan for job in jobs]
+
+    scene_names = [job.scene.name for job in jobs]
+    raw_plans: dict[str, Any] = {}
+
+    if len(jobs) > 1 and len(set(scene_names)) == len(scene_names):
+        batch_request = SceneBatchRequest(
+            scenes=[
+                SceneBatchEntry(
+                    scene_name=job.scene.name,
+                    scene_text=job.scene_text,
+                    fallback_segments=job.fallback_plan,
+                    audio_metadata={"byte_length": job.audio_size},
+                )
+                for job in jobs
+            ]
+        )
+        try:
+            agent_result = await agents.longform_clause_agent.run(batch_request.model_dump_json())
+        except Exception as error:  # pragma: no cover - external service
+            logger.warning("Batched clause segmentation agent failed: %s", error)
+        else:
+            raw_plans = _parse_clause_agent_batch(agent_result.output)
+
+    plans: list[list[SegmentPausePlan] | None] = []
+    missed: list[int] = []
+    for index, job in enumerate(jobs):
+        raw_segments = raw_plans.get(job.scene.name)
+        agent_segments = (
+            _parse_clause_agent_segments({"segments": raw_segments})
+            if raw_segments is not None
+            else []
+        )
+
+        if not agent_segments:
+            missed.append(index)
+            plans.append(None)
+            continue
+
+        logger.info(
+            "Batched clause agent plan for '%s': %s",
+            job.scene.name,
+            _plan_debug_snapshot(agent_segments),
+        )
+        plans.append(_validate_agent_plan(job.fallback_plan, agent_segments, job.scene.name))
+
+    # Scenes the batch did not cover are segmented concurrently, not one round trip at a time.
+    individual_plans = await asyncio.gather(
+        *(
+            _derive_segment_plan(
+                scene_name=jobs[index].scene.name,
+                scene_text=jobs[index].scene_text,
+                audio_size=jobs[index].audio_size,
+                fallback_plan=jobs[index].fallback_plan,
+            )
+            for index in missed
+        )
+    )
+    for index, plan in zip(missed, individual_plans, strict=True):
+        plans[index] = plan
+
+    return cast(list[list[SegmentPausePlan]], plans)
+
+
 async def _build_elevenlabs_plan(scenes: list[SceneBlock]) -> LongFormAudioPlan:
     if not scenes:
         raise HTTPException(status_code=422, detail="No scenes available for synthesis.")
@@ -290,15 +517,15 @@ async def _build_elevenlabs_plan(scenes: list[SceneBlock]) -> LongFormAudioPlan:
     }
 
     try:
-        agent_response = await longform_audio_agent.run(json.dumps(payload, ensure_ascii=False))
+        agent_response = await agents.longform_audio_agent.run(orjson.dumps(payload).decode())
     except Exception as error:  # pragma: no cover - external service
         logger.warning("ElevenLabs audio tagging agent failed: %s", error)
         raise HTTPException(status_code=502, detail="ElevenLabs audio tagging failed.") from error
 
     try:
-        plan_payload = json.loads(agent_response.output)
+        plan_payload = orjson.loads(agent_response.output)
         plan = LongFormAudioPlan.model_validate(plan_payload)
-    except (json.JSONDecodeError, ValidationError) as error:
+    except (orjson.JSONDecodeError, ValidationError) as error:
         logger.warning("ElevenLabs audio tagging agent returned invalid payload: %s", error)
         raise HTTPException(
             status_code=502,
@@ -321,15 +548,18 @@ async def _build_elevenlabs_plan(scenes: list[SceneBlock]) -> LongFormAudioPlan:
 
 def _fallback_split_points(audio: AudioSegment, plan: list[SegmentPausePlan]) -> list[int]:
     total_ms = len(audio)
-    char_weights = [max(len(segment.text.strip()), 1) for segment in plan]
-    total_weight = sum(char_weights) or 1
-    split_points: list[int] = []
-    cumulative_weight = 0
+    char_weights = np.fromiter(
+        (max(len(segment.text.strip()), 1) for segment in plan),
+        dtype=np.int64,
+        count=len(plan),
+    )
+    total_weight = int(char_weights.sum()) or 1
+    cumulative_weights = np.cumsum(char_weights[:-1])
+    targets = np.rint(total_ms * (cumulative_weights / total_weight)).astype(np.int64)
+    targets = np.minimum(np.maximum(targets, 1), total_ms - 1)
 
-    for weight in char_weights[:-1]:
-        cumulative_weight += weight
-        target = int(round(total_ms * (cumulative_weight / total_weight)))
-        target = min(max(target, 1), total_ms - 1)
+    split_points: list[int] = []
+    for target in targets.tolist():
         if split_points and target <= split_points[-1]:
             target = min(split_points[-1] + 1, total_ms - 1)
         split_points.append(target)
@@ -347,28 +577,22 @@ def _map_silence_to_targets(
 
     available = sorted(point for point in silence_midpoints if 0 < point < total_ms)
     chosen_points: list[int] = []
+    cursor = 0
 
+    # Targets and silences are both ascending, so a single forward sweep finds the
+    # nearest unused silence for each target without rescanning consumed entries.
     for target in target_points:
-        best_index: int | None = None
-        best_point: int | None = None
-        best_delta: int | None = None
-
-        for index, point in enumerate(available):
-            delta = abs(point - target)
-            if best_delta is None or delta < best_delta:
-                best_delta = delta
-                best_point = point
-                best_index = index
-            if delta <= 80:  # perfect match, stop searching
+        while cursor + 1 < len(available):
+            if abs(available[cursor + 1] - target) >= abs(available[cursor] - target):
                 break
+            cursor += 1
 
         if (
-            best_point is not None
-            and best_delta is not None
-            and best_delta <= SPLIT_SILENCE_MAX_OFFSET_MS
+            cursor < len(available)
+            and abs(available[cursor] - target) <= SPLIT_SILENCE_MAX_OFFSET_MS
         ):
-            chosen = best_point
-            del available[best_index]  # type: ignore[arg-type]
+            chosen = available[cursor]
+            cursor += 1
         else:
             chosen = target
 
@@ -380,29 +604,103 @@ def _map_silence_to_targets(
     return chosen_points
 
 
-def _measure_trailing_silence(
-    segment: AudioSegment,
+def _segment_samples(segment: AudioSegment) -> np.ndarray:
+    """Return a zero-copy view of the interleaved PCM samples backing a segment."""
+
+    return np.frombuffer(segment.raw_data, dtype=PCM_SAMPLE_DTYPES[segment.sample_width])
+
+
+def _silent_windows(
+    audio: AudioSegment,
+    window_starts: np.ndarray,
+    window_ends: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """Flag the windows whose RMS is at or below ``threshold``.
+
+    Window energies are differences of one running sum of per-frame squared samples,
+    so each window is scored in O(1) without materialising overlapping slices. Window
+    bounds and the truncated RMS follow ``AudioSegment`` slicing and ``audioop.rms``.
+    """
+
+    # Squared 32-bit samples overflow int64 once summed; audioop accumulates in double too.
+    accumulator = np.float64 if audio.sample_width == 4 else np.int64
+    samples = _segment_samples(audio).astype(accumulator)
+    # ``samples`` is a fresh copy, so square it in place rather than allocating again.
+    np.square(samples, out=samples)
+    frame_energy = (
+        samples if audio.channels == 1 else samples.reshape(-1, audio.channels).sum(axis=1)
+    )
+    frame_count = frame_energy.shape[0]
+
+    energy = np.zeros(frame_count + 1, dtype=accumulator)
+    np.cumsum(frame_energy, out=energy[1:])
+
+    frames_per_ms = audio.frame_rate / 1000.0
+    start_frames = (window_starts * frames_per_ms).astype(np.int64)
+    end_frames = (window_ends * frames_per_ms).astype(np.int64)
+    # Frames past the end are zero padded by pydub: they add no energy but still count.
+    sample_counts = np.maximum((end_frames - start_frames) * audio.channels, 1)
+    window_energy = (
+        energy[np.minimum(end_frames, frame_count)] - energy[np.minimum(start_frames, frame_count)]
+    )
+
+    rms = np.floor(np.sqrt(window_energy / sample_counts))
+    return rms <= threshold
+
+
+def _detect_silence(
+    audio: AudioSegment,
+    min_silence_len: int,
     silence_thresh: float,
-    chunk_size: int = 10,
-) -> int:
-    """Return the trailing silence duration (ms) for a segment."""
+    seek_step: int,
+) -> list[list[int]]:
+    """Vectorized equivalent of ``pydub.silence.detect_silence``."""
 
-    if len(segment) == 0:
-        return 0
+    seg_len = len(audio)
+    if seg_len < min_silence_len:
+        return []
+
+    threshold = db_to_float(silence_thresh) * audio.max_possible_amplitude
+    last_slice_start = seg_len - min_silence_len
+    slice_starts = np.arange(0, last_slice_start + 1, seek_step, dtype=np.int64)
+    if last_slice_start % seek_step:
+        slice_starts = np.append(slice_starts, last_slice_start)
+
+    silence_starts = slice_starts[
+        _silent_windows(audio, slice_starts, slice_starts + min_silence_len, threshold)
+    ]
+    if silence_starts.size == 0:
+        return []
 
-    trimmed = segment
-    trailing_ms = 0
-    reverse_cursor = len(trimmed)
+    # Adjacent silent windows merge unless they are neither consecutive seek steps nor
+    # overlapping, which is exactly where pydub closes one range and opens the next.
+    gaps = np.diff(silence_starts)
+    breaks = np.flatnonzero((gaps != seek_step) & (gaps > min_silence_len))
+    range_starts = np.concatenate((silence_starts[:1], silence_starts[breaks + 1]))
+    range_ends = np.concatenate((silence_starts[breaks], silence_starts[-1:])) + min_silence_len
+    return np.column_stack((range_starts, range_ends)).tolist()
 
-    while reverse_cursor > 0:
-        start = max(reverse_cursor - chunk_size, 0)
-        chunk = cast(AudioSegment, trimmed[start:reverse_cursor])
-        if chunk.dBFS > silence_thresh:
-            break
-        trailing_ms += reverse_cursor - start
-        reverse_cursor = start
 
-    return trailing_ms
+def _measure_trailing_silence(segment: AudioSegment, silence_thresh: float) -> int:
+    """Return the trailing silence duration (ms) for a segment.
+
+    The segment is scored backwards in ``TRAILING_SILENCE_CHUNK_MS`` chunks; trailing
+    silence ends at the last chunk whose dBFS rises above ``silence_thresh``.
+    """
+
+    seg_len = len(segment)
+    if seg_len == 0:
+        return 0
+
+    threshold = db_to_float(silence_thresh) * segment.max_possible_amplitude
+    chunk_ends = np.arange(seg_len, 0, -TRAILING_SILENCE_CHUNK_MS, dtype=np.int64)
+    chunk_starts = np.maximum(chunk_ends - TRAILING_SILENCE_CHUNK_MS, 0)
+    loud_chunks = np.flatnonzero(~_silent_windows(segment, chunk_starts, chunk_ends, threshold))
+    if loud_chunks.size == 0:
+        return seg_len
+
+    return seg_len - int(chunk_ends[loud_chunks[0]])
 
 
 def _trim_trailing_silence_to(
@@ -425,23 +723,15 @@ def _trim_trailing_silence_to(
     return trimmed_segment, target_ms
 
 
-def _slice_and_pause(audio_bytes: bytes, plan: list[SegmentPausePlan]) -> bytes:
-    audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=AUDIO_FORMAT)
-    if not plan:
-        return audio_bytes
-
-    if len(plan) == 1:
-        pause_ms = int(round(plan[0].pause_after_seconds * 1000))
-        processed = audio + AudioSegment.silent(duration=pause_ms)
-        buffer = io.BytesIO()
-        processed.export(buffer, format=AUDIO_FORMAT)
-        buffer.seek(0)
-        return buffer.getvalue()
-
-    silence_ranges = detect_silence(
+def _silence_split_points(
+    audio: AudioSegment,
+    plan: list[SegmentPausePlan],
+    silence_thresh: float,
+) -> list[int]:
+    silence_ranges = _detect_silence(
         audio,
         min_silence_len=350,
-        silence_thresh=audio.dBFS - 16,
+        silence_thresh=silence_thresh,
         seek_step=10,
     )
     silence_midpoints: list[int] = []
@@ -452,17 +742,140 @@ def _slice_and_pause(audio_bytes: bytes, plan: list[SegmentPausePlan]) -> bytes:
     target_points = _fallback_split_points(audio, plan)
 
     if silence_midpoints:
-        split_points = _map_silence_to_targets(target_points, silence_midpoints, len(audio))
-    else:
-        split_points = target_points
+        return _map_silence_to_targets(target_points, silence_midpoints, len(audio))
+    return target_points
+
+
+def _load_scene_pcm(audio_file: IO[bytes]) -> AudioSegment:
+    audio_file.seek(0)
+    pcm_data = audio_file.read()
+    # Drop a dangling partial sample rather than failing on a truncated stream.
+    pcm_data = pcm_data[: len(pcm_data) - len(pcm_data) % ELEVENLABS_PCM_SAMPLE_WIDTH]
+    return AudioSegment(
+        data=pcm_data,
+        sample_width=ELEVENLABS_PCM_SAMPLE_WIDTH,
+        frame_rate=ELEVENLABS_PCM_FRAME_RATE,
+        channels=ELEVENLABS_PCM_CHANNELS,
+    )
+
+
+def _encode_audio(segment: AudioSegment) -> bytes:
+    buffer = io.BytesIO()
+    segment.export(buffer, format=AUDIO_FORMAT)
+    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def _strip_alignment_markup(alignment: SceneAlignment) -> SceneAlignment:
+    """Drop the alignment entries that belong to audio tags or SSML."""
+
+    raw_text = "".join(alignment.characters)
+    if "[" not in raw_text and "<" not in raw_text:
+        return alignment
+
+    # Tags may span many alignment entries, so they are located on the joined text and
+    # every entry that starts inside one is dropped.
+    entry_offsets = np.cumsum([0, *map(len, alignment.characters[:-1])])
+    markup = np.zeros(len(raw_text) + 1, dtype=np.int64)
+    for match in AUDIO_MARKUP_PATTERN.finditer(raw_text):
+        markup[match.start()] += 1
+        markup[match.end()] -= 1
+    kept = np.flatnonzero(np.cumsum(markup)[entry_offsets] == 0).tolist()
+    return SceneAlignment(
+        characters=[alignment.characters[index] for index in kept],
+        start_times_ms=[alignment.start_times_ms[index] for index in kept],
+        end_times_ms=[alignment.end_times_ms[index] for index in kept],
+    )
+
+
+def _alignment_split_points(
+    alignment: SceneAlignment,
+    plan: list[SegmentPausePlan],
+    total_ms: int,
+) -> list[int] | None:
+    """Place each split midway between a segment's last character and the next one.
+
+    Characters are compared after dropping audio tags, SSML and markup; ``None`` is
+    returned when the aligned text does not match the plan so callers fall back to
+    silence detection.
+    """
+
+    alignment = _strip_alignment_markup(alignment)
+    start_times: list[int] = []
+    end_times: list[int] = []
+    aligned_text: list[str] = []
+    for character, start_ms, end_ms in zip(
+        alignment.characters, alignment.start_times_ms, alignment.end_times_ms, strict=False
+    ):
+        normalized = character.translate(MARKUP_NORMALIZATION_TABLE)
+        if not normalized:
+            continue
+        aligned_text.append(normalized)
+        start_times.extend([start_ms] * len(normalized))
+        end_times.extend([end_ms] * len(normalized))
+
+    segment_texts = [
+        AUDIO_MARKUP_PATTERN.sub("", segment.text).translate(MARKUP_NORMALIZATION_TABLE)
+        for segment in plan
+    ]
+    if "".join(aligned_text) != "".join(segment_texts):
+        return None
+
+    split_points: list[int] = []
+    boundary = 0
+    for segment_text in segment_texts[:-1]:
+        boundary += len(segment_text)
+        if boundary == 0 or boundary >= len(end_times):
+            return None
+        split_point = (end_times[boundary - 1] + start_times[boundary]) // 2
+        if not 0 < split_point < total_ms or (split_points and split_point <= split_points[-1]):
+            return None
+        split_points.append(split_point)
+
+    return split_points
+
+
+def _slice_and_pause(
+    audio_file: IO[bytes],
+    plan: list[SegmentPausePlan],
+    alignment: SceneAlignment | None = None,
+) -> tuple[bytes, AudioSegment]:
+    """Splice pauses into a scene's PCM and return the encoded audio with its samples.
+
+    The returned segment lets the final mixdown reuse the PCM instead of decoding the
+    encoded scene audio again.
+    """
+
+    audio = _load_scene_pcm(audio_file)
+
+    # A lone sentence with no pause needs no splicing or padding. Multi-sentence plans
+    # still run even at zero pause because excess inter-sentence silence is trimmed.
+    if not plan or (len(plan) == 1 and plan[0].pause_after_ms == 0):
+        return _encode_audio(audio), audio
+
+    if len(plan) == 1:
+        pause_ms = plan[0].pause_after_ms
+        processed = audio + AudioSegment.silent(duration=pause_ms)
+        return _encode_audio(processed), processed
+
+    silence_thresh = audio.dBFS - 16
+    split_points = (
+        _alignment_split_points(alignment, plan, len(audio)) if alignment is not None else None
+    )
+    if split_points is None:
+        # Short scenes rarely drift far from the character-weighted estimate, so they
+        # skip the full silence scan.
+        if len(audio) < settings.LONGFORM_SILENCE_DETECT_MIN_MS:
+            split_points = _fallback_split_points(audio, plan)
+        else:
+            split_points = _silence_split_points(audio, plan, silence_thresh)
 
     stitched = AudioSegment.silent(duration=0)
     cursor = 0
     for index, split_point in enumerate(split_points):
         segment_audio = audio[cursor:split_point]
-        pause_ms = int(round(plan[index].pause_after_seconds * 1000))
+        pause_ms = plan[index].pause_after_ms
 
-        silence_thresh = audio.dBFS - 16
         tolerance_ms = 60
         existing_silence_ms = _measure_trailing_silence(segment_audio, silence_thresh)
 
@@ -482,19 +895,52 @@ def _slice_and_pause(audio_bytes: bytes, plan: list[SegmentPausePlan]) -> bytes:
         cursor = split_point
 
     stitched += audio[cursor:]
-    final_pause_ms = int(round(plan[-1].pause_after_seconds * 1000))
+    final_pause_ms = plan[-1].pause_after_ms
     if final_pause_ms > 0:
-        silence_thresh = audio.dBFS - 16
         existing_final_ms = _measure_trailing_silence(stitched, silence_thresh)
         if existing_final_ms - final_pause_ms > 60:
             stitched, _ = _trim_trailing_silence_to(stitched, final_pause_ms, silence_thresh)
         elif final_pause_ms - existing_final_ms > 60:
             stitched += AudioSegment.silent(duration=final_pause_ms - existing_final_ms)
 
-    buffer = io.BytesIO()
-    stitched.export(buffer, format=AUDIO_FORMAT)
-    buffer.seek(0)
-    return buffer.getvalue()
+    return _encode_audio(stitched), stitched
+
+
+def _concatenate_segments(segments: list[AudioSegment]) -> AudioSegment:
+    """Join segments with one ``b"".join`` over their raw PCM instead of repeated additions.
+
+    Segments whose format differs from the widest one are converted first, matching
+    the parameter syncing pydub applies when adding segments.
+    """
+
+    sample_width = max(segment.sample_width for segment in segments)
+    frame_rate = max(segment.frame_rate for segment in segments)
+    channels = max(segment.channels for segment in segments)
+
+    pcm_chunks: list[bytes] = []
+    for segment in segments:
+        if (segment.sample_width, segment.frame_rate, segment.channels) != (
+            sample_width,
+            frame_rate,
+            channels,
+        ):
+            segment = (
+                segment.set_sample_width(sample_width)
+                .set_frame_rate(frame_rate)
+                .set_channels(channels)
+            )
+        pcm_chunks.append(segment.raw_data)
+
+    return AudioSegment(
+        data=b"".join(pcm_chunks),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels,
+    )
+
+
+def _render_final_audio(scene_segments: list[AudioSegment]) -> bytes:
+    return _encode_audio(_concatenate_segments(scene_segments))
 
 
 def _build_clause_metrics(
@@ -586,15 +1032,15 @@ async def _request_splice_adjustments(
         }
 
     try:
-        response = await longform_splice_agent.run(json.dumps(payload, ensure_ascii=False))
+        response = await agents.longform_splice_agent.run(orjson.dumps(payload).decode())
     except Exception as error:  # pragma: no cover - external service
         logger.warning("Splice agent failed for scene '%s': %s", scene_name, error)
         return {}
 
     try:
-        adjustments_payload = json.loads(response.output)
+        adjustments_payload = orjson.loads(response.output)
         adjustments = PauseAdjustmentResponse.model_validate(adjustments_payload)
-    except (json.JSONDecodeError, ValidationError) as error:
+    except (orjson.JSONDecodeError, ValidationError) as error:
         logger.warning("Invalid splice agent payload for scene '%s': %s", scene_name, error)
         return {}
 
@@ -630,7 +1076,107 @@ def _apply_pause_adjustments(
     return (updated_plan if changed else plan), changed
 
 
-async def _generate_scene_audio(scene_text: str, voice_id: str) -> bytes:
+def _ensure_elevenlabs_client() -> httpx.AsyncClient:
+    global _elevenlabs_client
+    if _elevenlabs_client is None or _elevenlabs_client.is_closed:
+        _elevenlabs_client = httpx.AsyncClient(timeout=ELEVENLABS_TIMEOUT_SECONDS)
+    return _elevenlabs_client
+
+
+async def close_elevenlabs_client() -> None:
+    """Close the pooled ElevenLabs client; called on application shutdown."""
+
+    global _elevenlabs_client
+    if _elevenlabs_client is not None:
+        await _elevenlabs_client.aclose()
+        _elevenlabs_client = None
+
+
+def _extend_alignment(
+    alignment: SceneAlignment,
+    payload: object,
+    chunk_offset_ms: int,
+) -> bool:
+    """Append one streamed alignment chunk; return ``False`` if it is malformed."""
+
+    if payload is None:
+        return True
+    if not isinstance(payload, dict):
+        return False
+
+    characters = payload.get("characters") or []
+    start_seconds = payload.get("character_start_times_seconds") or []
+    end_seconds = payload.get("character_end_times_seconds") or []
+    if not (len(characters) == len(start_seconds) == len(end_seconds)):
+        return False
+    if not characters:
+        return True
+
+    # Chunks may carry times relative to their own audio; shift those onto the scene.
+    offset_ms = 0
+    if (
+        alignment.end_times_ms
+        and start_seconds[0] * 1000 < alignment.end_times_ms[-1] - ALIGNMENT_RESTART_TOLERANCE_MS
+    ):
+        offset_ms = chunk_offset_ms
+
+    alignment.characters.extend(characters)
+    alignment.start_times_ms.extend(int(value * 1000) + offset_ms for value in start_seconds)
+    alignment.end_times_ms.extend(int(value * 1000) + offset_ms for value in end_seconds)
+    return True
+
+
+def _extend_input_spans(
+    input_spans_ms: dict[int, tuple[int, int]],
+    payload: object,
+    chunk_offset_ms: int,
+) -> None:
+    """Widen each dialogue input's span with one streamed chunk's voice segments."""
+
+    if not isinstance(payload, list):
+        return
+    latest_end_ms = max((end_ms for _, end_ms in input_spans_ms.values()), default=0)
+    for voice_segment in payload:
+        if not isinstance(voice_segment, dict):
+            continue
+        input_index = voice_segment.get("dialogue_input_index")
+        start_seconds = voice_segment.get("start_time_seconds")
+        end_seconds = voice_segment.get("end_time_seconds")
+        if not isinstance(input_index, int) or not isinstance(start_seconds, int | float):
+            continue
+        if not isinstance(end_seconds, int | float):
+            continue
+        start_ms = int(start_seconds * 1000)
+        end_ms = int(end_seconds * 1000)
+        # Same chunk-relative timing guard as the character alignment.
+        if start_ms < latest_end_ms - ALIGNMENT_RESTART_TOLERANCE_MS:
+            start_ms += chunk_offset_ms
+            end_ms += chunk_offset_ms
+        if input_index in input_spans_ms:
+            known_start_ms, known_end_ms = input_spans_ms[input_index]
+            start_ms, end_ms = min(start_ms, known_start_ms), max(end_ms, known_end_ms)
+        input_spans_ms[input_index] = (start_ms, end_ms)
+
+
+def _empty_elevenlabs_audio_error() -> HTTPException:
+    return HTTPException(status_code=502, detail="ElevenLabs returned no audio.")
+
+
+async def _generate_scene_audio(
+    scene_texts: list[str],
+    voice_id: str,
+) -> tuple[IO[bytes], SceneAlignment | None, dict[int, tuple[int, int]]]:
+    """Stream synthesized raw PCM audio for one or more scenes and its timings.
+
+    Each scene text becomes one dialogue input, so the inputs come back as a single
+    continuous stream. The dialogue ``/stream/with-timestamps`` endpoint sends audio as
+    it is generated, so chunks are spooled while the rest is still being synthesized.
+    Small requests stay in memory; longer ones roll over to disk once they exceed
+    ``SCENE_AUDIO_SPOOL_MAX_BYTES``. The alignment is ``None`` when it was missing or
+    malformed. The last element maps each dialogue input index to the ``(start_ms,
+    end_ms)`` span its reported voice segments cover.
+    """
+
     if not settings.ELEVENLABS_API_KEY:
         raise HTTPException(status_code=400, detail="ELEVENLABS_API_KEY is not configured.")
     if not voice_id.strip():
@@ -645,6 +1191,7 @@ async def _generate_scene_audio(scene_text: str, voice_id: str) -> bytes:
                 "text": scene_text,
                 "voice_id": voice_id.strip(),
             }
+            for scene_text in scene_texts
         ]
     }
     headers = {
@@ -652,30 +1199,60 @@ async def _generate_scene_audio(scene_text: str, voice_id: str) -> bytes:
         "Content-Type": "application/json",
     }
 
-    def _request() -> bytes:
-        response = requests.post(
-            settings.ELEVENLABS_URL,
-            json=payload,
-            headers=headers,
-            timeout=ELEVENLABS_TIMEOUT_SECONDS,
-        )
-        if response.status_code != 200:
-            logger.warning(
-                "ElevenLabs synthesis failed (status=%s): %s",
-                response.status_code,
-                response.text,
-            )
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.content
-
+    # The spooled file is handed to the caller, which closes it once the scene is stitched.
+    audio_file = tempfile.SpooledTemporaryFile(max_size=SCENE_AUDIO_SPOOL_MAX_BYTES)  # noqa: SIM115
+    alignment: SceneAlignment | None = SceneAlignment()
+    input_spans_ms: dict[int, tuple[int, int]] = {}
     try:
-        return await run_in_threadpool(_request)
+        async with (
+            _elevenlabs_semaphore,
+            _ensure_elevenlabs_client().stream(
+                "POST",
+                f"{settings.ELEVENLABS_URL.rstrip('/')}/stream/with-timestamps",
+                params={"output_format": settings.ELEVENLABS_PCM_FORMAT},
+                json=payload,
+                headers=headers,
+            ) as response,
+        ):
+            if response.status_code != 200:
+                await response.aread()
+                logger.warning(
+                    "ElevenLabs synthesis failed (status=%s): %s",
+                    response.status_code,
+                    response.text,
+                )
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+            pcm_bytes_written = 0
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = orjson.loads(line)
+                chunk_offset_ms = pcm_bytes_written * 1000 // ELEVENLABS_PCM_BYTES_PER_SECOND
+                if audio_base64 := chunk.get("audio_base64"):
+                    pcm_bytes_written += audio_file.write(base64.b64decode(audio_base64))
+                if alignment is not None and not _extend_alignment(
+                    alignment, chunk.get("alignment"), chunk_offset_ms
+                ):
+                    logger.warning("Discarding malformed ElevenLabs alignment chunk")
+                    alignment = None
+                _extend_input_spans(input_spans_ms, chunk.get("voice_segments"), chunk_offset_ms)
     except HTTPException:
+        audio_file.close()
         raise
     except Exception as error:  # pragma: no cover - external service
+        audio_file.close()
         logger.error("ElevenLabs audio synthesis request failed: %s", error)
         raise HTTPException(status_code=502, detail="ElevenLabs audio synthesis failed.") from error
 
+    if pcm_bytes_written == 0:
+        audio_file.close()
+        raise _empty_elevenlabs_audio_error()
+
+    audio_file.seek(0)
+    if alignment is not None and not alignment.characters:
+        alignment = None
+    return audio_file, alignment, input_spans_ms
+
 
 def _validate_agent_plan(
     expected: list[SegmentPausePlan],
@@ -719,141 +1296,362 @@ def _validate_agent_plan(
     return candidate
 
 
-def _to_data_url(audio_bytes: bytes) -> str:
-    encoded = base64.b64encode(audio_bytes).decode("ascii")
-    return f"data:audio/mpeg;base64,{encoded}"
+def _scene_content_id(index: int) -> str:
+    return f"scene-{index}"
 
 
-async def process_longform_script(script: str) -> tuple[LongformScenesResponse, bytes]:
-    scenes = _parse_script(script)
-    audio_plan = await _build_elevenlabs_plan(scenes)
-    voice_id = audio_plan.voice_id.strip()
-    if not voice_id:
-        raise HTTPException(
-            status_code=502,
-            detail="ElevenLabs audio plan did not include a voice_id.",
+def _scene_audio_input(scene: SceneBlock, plan_segment: LongFormSegment) -> str:
+    if plan_segment.segment_id.strip() and plan_segment.segment_id.strip() != scene.name.strip():
+        logger.debug(
+            "Plan segment id mismatch (plan=%s scene=%s)",
+            plan_segment.segment_id,
+            scene.name,
         )
+    # Pause markers are stripped in a single pass from whichever text is synthesized.
+    return _remove_pause_markers(plan_segment.text.strip() or scene.raw_text)
 
-    summaries: list[SceneProcessingSummary] = []
-    processed_scene_audio: list[bytes] = []
 
-    for index, scene in enumerate(scenes):
-        raw_text = scene.raw_text
-        if not raw_text:
-            logger.warning("Skipping empty scene '%s'", scene.name)
-            continue
+def _batch_scene_inputs(scene_texts: list[str]) -> list[list[int]]:
+    """Group consecutive scene indices into dialogue requests under the character cap."""
 
-        fallback_plan = _fallback_sentence_plan(raw_text)
-        cleaned_text = _remove_pause_markers(raw_text)
-
-        plan_segment = audio_plan.segments[index]
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_characters = 0
+    for index, scene_text in enumerate(scene_texts):
         if (
-            plan_segment.segment_id.strip()
-            and plan_segment.segment_id.strip() != scene.name.strip()
+            current
+            and current_characters + len(scene_text) > settings.ELEVENLABS_BATCH_MAX_CHARACTERS
         ):
-            logger.debug(
-                "Plan segment id mismatch (plan=%s scene=%s)",
-                plan_segment.segment_id,
-                scene.name,
-            )
-        plan_text = plan_segment.text.strip() or cleaned_text
-        audio_input_text = _remove_pause_markers(plan_text)
+            batches.append(current)
+            current = []
+            current_characters = 0
+        current.append(index)
+        current_characters += len(scene_text)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _input_span_split_points(
+    input_spans_ms: dict[int, tuple[int, int]],
+    input_count: int,
+    total_ms: int,
+) -> list[int] | None:
+    """Place each scene boundary midway between consecutive dialogue inputs."""
 
-        audio_bytes = await _generate_scene_audio(audio_input_text, voice_id)
+    if any(index not in input_spans_ms for index in range(input_count)):
+        return None
+    split_points: list[int] = []
+    for index in range(input_count - 1):
+        split_point = (input_spans_ms[index][1] + input_spans_ms[index + 1][0]) // 2
+        if not 0 < split_point < total_ms or (split_points and split_point <= split_points[-1]):
+            return None
+        split_points.append(split_point)
+    return split_points
 
-        final_plan = await _derive_segment_plan(
-            scene_name=scene.name,
-            scene_text=raw_text,
-            audio_bytes=audio_bytes,
-            fallback_plan=fallback_plan,
-        )
 
-        plan_source = "agent" if final_plan is not fallback_plan else "fallback"
-        logger.info(
-            "Scene '%s' using %s segmentation plan: %s",
-            scene.name,
-            plan_source,
-            _plan_debug_snapshot(final_plan),
+def _split_batch_audio(
+    audio_file: IO[bytes],
+    alignment: SceneAlignment | None,
+    input_spans_ms: dict[int, tuple[int, int]],
+    scene_texts: list[str],
+) -> list[tuple[IO[bytes], SceneAlignment | None]]:
+    """Cut a batched dialogue stream back into per-scene PCM files and alignments.
+
+    Scene boundaries come from the voice segments reported per dialogue input, then
+    from the character timings (ignoring audio tags and SSML), and finally from the
+    silences nearest to a character-weighted estimate, so the paid audio is always used.
+    """
+
+    total_bytes = audio_file.seek(0, io.SEEK_END)
+    if total_bytes == 0:
+        raise _empty_elevenlabs_audio_error()
+    total_ms = total_bytes * 1000 // ELEVENLABS_PCM_BYTES_PER_SECOND
+    scene_plan = [
+        SegmentPausePlan(text=AUDIO_MARKUP_PATTERN.sub("", scene_text), pause_after_seconds=0.0)
+        for scene_text in scene_texts
+    ]
+    boundaries_ms = _input_span_split_points(input_spans_ms, len(scene_texts), total_ms)
+    if boundaries_ms is None and alignment is not None:
+        boundaries_ms = _alignment_split_points(alignment, scene_plan, total_ms)
+    if boundaries_ms is None:
+        logger.warning(
+            "Splitting batched ElevenLabs audio for %d scenes on silences", len(scene_texts)
         )
+        audio = _load_scene_pcm(audio_file)
+        boundaries_ms = _silence_split_points(audio, scene_plan, audio.dBFS - 16)
+    # A stream shorter than its scene count can yield out-of-range or unordered points;
+    # clamped and sorted, every slice is at worst empty rather than inverted.
+    boundaries_ms = sorted(min(max(boundary_ms, 0), total_ms) for boundary_ms in boundaries_ms)
+
+    frame_bytes = ELEVENLABS_PCM_SAMPLE_WIDTH * ELEVENLABS_PCM_CHANNELS
+    boundary_bytes = [
+        boundary_ms * ELEVENLABS_PCM_FRAME_RATE // 1000 * frame_bytes
+        for boundary_ms in boundaries_ms
+    ]
+    scene_starts_ms = [0, *boundaries_ms]
+    scene_starts_bytes = [0, *boundary_bytes]
+    scene_ends_bytes = [*boundary_bytes, total_bytes]
+
+    scene_alignments: list[SceneAlignment | None] = [None] * len(scene_texts)
+    if alignment is not None:
+        # Markup is not spoken and may straddle a boundary, so only spoken text is split.
+        spoken = _strip_alignment_markup(alignment)
+        split_alignments = [SceneAlignment() for _ in scene_texts]
+        scene_index = 0
+        for character, start_ms, end_ms in zip(
+            spoken.characters, spoken.start_times_ms, spoken.end_times_ms, strict=True
+        ):
+            while scene_index < len(boundaries_ms) and start_ms >= boundaries_ms[scene_index]:
+                scene_index += 1
+            offset_ms = scene_starts_ms[scene_index]
+            scene_alignment = split_alignments[scene_index]
+            scene_alignment.characters.append(character)
+            scene_alignment.start_times_ms.append(max(start_ms - offset_ms, 0))
+            scene_alignment.end_times_ms.append(max(end_ms - offset_ms, 0))
+        scene_alignments = [
+            scene_alignment if scene_alignment.characters else None
+            for scene_alignment in split_alignments
+        ]
 
-        processed_audio = _slice_and_pause(audio_bytes, final_plan)
+    parts: list[tuple[IO[bytes], SceneAlignment | None]] = []
+    try:
+        for start, end, scene_alignment in zip(
+            scene_starts_bytes, scene_ends_bytes, scene_alignments, strict=True
+        ):
+            # Each scene file is handed to its job, which closes it once the scene is stitched.
+            scene_file = tempfile.SpooledTemporaryFile(max_size=SCENE_AUDIO_SPOOL_MAX_BYTES)  # noqa: SIM115
+            parts.append((scene_file, scene_alignment))
+            audio_file.seek(start)
+            scene_file.write(audio_file.read(end - start))
+            scene_file.seek(0)
+    except Exception:
+        for scene_file, _ in parts:
+            scene_file.close()
+        raise
+    return parts
+
+
+async def _synthesize_scene_batch(
+    scenes: list[SceneBlock],
+    scene_texts: list[str],
+    voice_id: str,
+) -> list[SceneAudioJob]:
+    """Synthesize consecutive scenes with one dialogue request and split the result."""
+
+    # Planned before synthesis so a scene that cannot be segmented fails before any spend.
+    fallback_plans = [_fallback_sentence_plan(scene.raw_text) for scene in scenes]
+    audio_file, alignment, input_spans_ms = await _generate_scene_audio(scene_texts, voice_id)
 
+    parts: list[tuple[IO[bytes], SceneAlignment | None]]
+    if len(scene_texts) == 1:
+        parts = [(audio_file, alignment)]
+    else:
         try:
-            timing_analysis = await analyze_scene_audio(processed_audio, final_plan)
-        except Exception as error:  # pragma: no cover - diagnostic path
-            logger.warning("Timing analysis failed for scene '%s': %s", scene.name, error)
-            timing_analysis = None
+            parts = await run_in_threadpool(
+                _split_batch_audio, audio_file, alignment, input_spans_ms, scene_texts
+            )
+        finally:
+            audio_file.close()
 
-        adjustments = await _request_splice_adjustments(
-            scene.name,
-            final_plan,
-            timing_analysis,
-            processed_audio,
+    return [
+        SceneAudioJob(
+            scene=scene,
+            scene_text=scene.raw_text,
+            fallback_plan=fallback_plan,
+            audio_file=scene_file,
+            audio_size=scene_file.seek(0, io.SEEK_END),
+            alignment=scene_alignment,
         )
+        for scene, fallback_plan, (scene_file, scene_alignment) in zip(
+            scenes, fallback_plans, parts, strict=True
+        )
+    ]
+
+
+async def _process_scene(
+    index: int,
+    job: SceneAudioJob,
+    final_plan: list[SegmentPausePlan],
+) -> tuple[SceneProcessingSummary, bytes, AudioSegment]:
+    scene = job.scene
+
+    plan_source = "agent" if final_plan is not job.fallback_plan else "fallback"
+    logger.info(
+        "Scene '%s' using %s segmentation plan: %s",
+        scene.name,
+        plan_source,
+        _plan_debug_snapshot(final_plan),
+    )
+
+    processed_audio, processed_segment = await run_in_threadpool(
+        _slice_and_pause, job.audio_file, final_plan, job.alignment
+    )
 
-        if adjustments:
-            updated_plan, changed = _apply_pause_adjustments(final_plan, adjustments)
-            if changed:
-                final_plan = updated_plan
-                processed_audio = _slice_and_pause(audio_bytes, final_plan)
-                try:
-                    timing_analysis = await analyze_scene_audio(processed_audio, final_plan)
-                except Exception as error:  # pragma: no cover - diagnostic path
-                    logger.warning(
-                        "Timing analysis failed after splice for scene '%s': %s",
-                        scene.name,
-                        error,
-                    )
-                    timing_analysis = None
-
-        processed_scene_audio.append(processed_audio)
-
-        summaries.append(
-            SceneProcessingSummary(
-                scene_name=scene.name,
-                segments=final_plan,
-                processed_audio_path=_to_data_url(processed_audio),
-                timing_analysis=timing_analysis,
+    try:
+        timing_analysis = await analyze_scene_audio(processed_audio, final_plan, processed_segment)
+    except Exception as error:  # pragma: no cover - diagnostic path
+        logger.warning("Timing analysis failed for scene '%s': %s", scene.name, error)
+        timing_analysis = None
+
+    adjustments = await _request_splice_adjustments(
+        scene.name,
+        final_plan,
+        timing_analysis,
+        processed_audio,
+    )
+
+    if adjustments:
+        updated_plan, changed = _apply_pause_adjustments(final_plan, adjustments)
+        if changed:
+            final_plan = updated_plan
+            processed_audio, processed_segment = await run_in_threadpool(
+                _slice_and_pause, job.audio_file, final_plan, job.alignment
             )
-        )
+            try:
+                timing_analysis = await analyze_scene_audio(
+                    processed_audio, final_plan, processed_segment
+                )
+            except Exception as error:  # pragma: no cover - diagnostic path
+                logger.warning(
+                    "Timing analysis failed after splice for scene '%s': %s",
+                    scene.name,
+                    error,
+                )
+                timing_analysis = None
+
+    summary = SceneProcessingSummary.model_construct(
+        scene_name=scene.name,
+        segments=final_plan,
+        processed_audio_path=f"cid:{_scene_content_id(index)}",
+        timing_analysis=timing_analysis,
+    )
+    return summary, processed_audio, processed_segment
+
 
-    if not processed_scene_audio:
-        raise HTTPException(status_code=422, detail="No scenes produced audio output.")
+async def process_longform_script(
+    script: str,
+) -> tuple[LongformScenesResponse, bytes, list[bytes]]:
+    """Synthesize, segment, and stitch every scene of a long-form script.
 
-    final_audio = AudioSegment.silent(duration=0)
-    for audio_bytes in processed_scene_audio:
-        final_audio += AudioSegment.from_file(io.BytesIO(audio_bytes), format=AUDIO_FORMAT)
+    Consecutive scenes share one ElevenLabs dialogue request up to
+    ``settings.ELEVENLABS_BATCH_MAX_CHARACTERS``; batches are synthesized and scenes
+    post-processed concurrently, with ElevenLabs requests bounded by
+    ``settings.MAX_ELEVENLABS_CONCURRENCY``. Audio is returned as raw bytes
+    alongside the metadata; the summary paths are ``cid:`` references to the matching
+    parts of the multipart response.
+    """
 
-    final_buffer = io.BytesIO()
-    final_audio.export(final_buffer, format=AUDIO_FORMAT)
-    final_buffer.seek(0)
-    final_bytes = final_buffer.getvalue()
+    scenes = _parse_script(script)
+    audio_plan = await _build_elevenlabs_plan(scenes)
+    voice_id = audio_plan.voice_id.strip()
+    if not voice_id:
+        raise HTTPException(
+            status_code=502,
+            detail="ElevenLabs audio plan did not include a voice_id.",
+        )
 
-    response_payload = LongformScenesResponse(
-        scenes=summaries,
-        final_audio_path=_to_data_url(final_bytes),
+    voiced_scenes: list[SceneBlock] = []
+    scene_texts: list[str] = []
+    for scene, plan_segment in zip(scenes, audio_plan.segments, strict=True):
+        if not scene.raw_text:
+            logger.warning("Skipping empty scene '%s'", scene.name)
+            continue
+        voiced_scenes.append(scene)
+        scene_texts.append(_scene_audio_input(scene, plan_segment))
+
+    # Collect every outcome first so audio from batches that did finish is still closed
+    # when another batch fails.
+    results = await asyncio.gather(
+        *(
+            _synthesize_scene_batch(
+                [voiced_scenes[index] for index in batch],
+                [scene_texts[index] for index in batch],
+                voice_id,
+            )
+            for batch in _batch_scene_inputs(scene_texts)
+        ),
+        return_exceptions=True,
     )
+    jobs = [job for result in results if not isinstance(result, BaseException) for job in result]
+
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        segment_plans = await _derive_segment_plans_batched(jobs)
+
+        scene_tasks = [
+            asyncio.ensure_future(_process_scene(index, job, final_plan))
+            for index, (job, final_plan) in enumerate(zip(jobs, segment_plans, strict=True))
+        ]
+        try:
+            processed = await asyncio.gather(*scene_tasks)
+        except BaseException:
+            # The scene files are closed below, so no sibling may still be reading them or
+            # spending Whisper and agent calls once one scene has failed.
+            for task in scene_tasks:
+                task.cancel()
+            await asyncio.gather(*scene_tasks, return_exceptions=True)
+            raise
+        summaries = [summary for summary, _, _ in processed]
+        processed_scene_audio = [audio for _, audio, _ in processed]
+        processed_segments = [segment for _, _, segment in processed]
+
+        if not processed_scene_audio:
+            raise HTTPException(status_code=422, detail="No scenes produced audio output.")
+
+        final_bytes = await run_in_threadpool(_render_final_audio, processed_segments)
+
+        response_payload = LongformScenesResponse.model_construct(
+            scenes=summaries,
+            final_audio_path=f"cid:{FINAL_AUDIO_CONTENT_ID}",
+        )
+
+        return response_payload, final_bytes, processed_scene_audio
+    finally:
+        for job in jobs:
+            job.audio_file.close()
 
-    return response_payload, final_bytes
+
+def _multipart_audio_headers(content_id: str, filename: str) -> bytes:
+    return (
+        f"--{MULTIPART_BOUNDARY}\r\n"
+        "Content-Type: audio/mpeg\r\n"
+        f"Content-ID: <{content_id}>\r\n"
+        f"Content-Disposition: attachment; filename={filename}\r\n\r\n"
+    ).encode()
 
 
 def build_multipart_response(
     metadata: LongformScenesResponse,
     final_audio: bytes,
+    scene_audio: list[bytes],
 ) -> Iterable[bytes]:
-    metadata_json = metadata.model_dump_json()
+    """Yield the multipart body as a few large chunks.
 
-    yield f"--{MULTIPART_BOUNDARY}\r\n".encode()
-    yield b"Content-Type: application/json\r\n\r\n"
-    yield metadata_json.encode("utf-8")
-    yield b"\r\n"
+    Part headers are folded into the bytes that surround each audio payload so the
+    server issues one write per audio part rather than one per header line.
+    """
 
-    yield f"--{MULTIPART_BOUNDARY}\r\n".encode()
-    yield b"Content-Type: audio/mpeg\r\n"
-    yield b"Content-Disposition: attachment; filename=longform.mp3\r\n\r\n"
+    yield b"".join(
+        [
+            f"--{MULTIPART_BOUNDARY}\r\n".encode(),
+            b"Content-Type: application/json\r\n\r\n",
+            _LONGFORM_RESPONSE_ADAPTER.dump_json(metadata),
+            b"\r\n",
+            _multipart_audio_headers(FINAL_AUDIO_CONTENT_ID, "longform.mp3"),
+        ]
+    )
     yield final_audio
-    yield b"\r\n"
-    yield f"--{MULTIPART_BOUNDARY}--\r\n".encode()
+
+    for index, audio in enumerate(scene_audio):
+        content_id = _scene_content_id(index)
+        yield b"\r\n" + _multipart_audio_headers(content_id, f"{content_id}.mp3")
+        yield audio
+
+    yield f"\r\n--{MULTIPART_BOUNDARY}--\r\n".encode()
 
 
 def multipart_media_type() -> str:
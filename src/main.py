@@ -2,6 +2,8 @@
 
 import logging
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -12,6 +14,8 @@ from fastapi.staticfiles import StaticFiles
 from starlette.requests import Request
 
 from api.v1.api import api_router
+from controllers.longform_scenes import close_elevenlabs_client
+from utils.audio_analysis import close_openai_client
 
 LOG_FORMAT = "[%(asctime)s] %(levelname)s %(name)s:%(lineno)d - %(message)s"
 
@@ -20,10 +24,19 @@ if not logging.getLogger().handlers:
 
 logger = logging.getLogger("innerbhakti.api")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await close_elevenlabs_client()
+    await close_openai_client()
+
+
 app = FastAPI(
     title="InnerBhakti Video Generation Automation",
     description="API for generating audio and video content using AI services",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -102,6 +115,21 @@ async def handle_unexpected_exception(request: Request, exc: Exception):
 
 
 if __name__ == "__main__":
+    import os
+    import sys
+
     import uvicorn
 
-    uvicorn.run(app, host="127.0.0.1", port=8002)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        # Multiple workers are spawned from an import string rather than the app object.
+        "main:app" if workers > 1 else app,
+        host="127.0.0.1",
+        port=8002,
+        # uvloop has no Windows build; see the uvicorn[standard] markers in uv.lock.
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+        # log_requests already records every request along with its duration.
+        access_log=False,
+    )
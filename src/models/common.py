@@ -0,0 +1,18 @@
+"""Constrained string types shared across the API models."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import AfterValidator, StringConstraints
+
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+def _blank_to_none(value: str | None) -> str | None:
+    return value or None
+
+
+OptionalStr = Annotated[StrippedStr | None, AfterValidator(_blank_to_none)]
+"""Stripped string where blank input is treated as missing."""
@@ -1,29 +1,20 @@
-from pydantic import BaseModel, Field, model_validator
+from typing import Annotated
+
+from pydantic import BaseModel, Field, StringConstraints, model_validator
+
+from models.common import NonEmptyStr, OptionalStr
 
 
 class LongFormSceneInput(BaseModel):
-    scene_id: str | None = None
-    title: str | None = None
-    text: str = Field(..., min_length=10)
+    scene_id: OptionalStr = None
+    title: OptionalStr = None
+    text: Annotated[str, StringConstraints(strip_whitespace=True, min_length=10)]
     pause_after_seconds: float = Field(default=0.0, ge=0.0)
     enforce_comma_pause: bool = Field(
         default=True,
         description="If true, apply 1.5s pauses after punctuation",
     )
 
-    @model_validator(mode="after")
-    def _normalize_scene(self) -> "LongFormSceneInput":
-        self.text = self.text.strip()
-        if not self.text:
-            raise ValueError("text cannot be empty")
-        if self.scene_id is not None:
-            scene = self.scene_id.strip()
-            self.scene_id = scene or None
-        if self.title is not None:
-            title = self.title.strip()
-            self.title = title or None
-        return self
-
 
 class DialogueLine(BaseModel):
     text: str
@@ -49,9 +40,9 @@ class StitchingInstructions(BaseModel):
 
 
 class LongFormSegment(BaseModel):
-    segment_id: str
-    text: str
-    emotion: str
+    segment_id: NonEmptyStr
+    text: NonEmptyStr
+    emotion: NonEmptyStr
     character_count: int = Field(..., ge=1)
     estimated_duration_seconds: float = Field(..., ge=0.0)
     pause_after_seconds: float = Field(default=0.0, ge=0.0)
@@ -60,72 +51,44 @@ class LongFormSegment(BaseModel):
         description="If true, insert SSML pauses after punctuation.",
     )
 
-    @model_validator(mode="after")
-    def _validate_fields(self) -> "LongFormSegment":
-        self.segment_id = self.segment_id.strip()
-        self.text = self.text.strip()
-        self.emotion = self.emotion.strip()
-        if not self.segment_id:
-            raise ValueError("segment_id cannot be empty")
-        if not self.text:
-            raise ValueError("text cannot be empty")
-        if not self.emotion:
-            raise ValueError("emotion cannot be empty")
-        return self
-
 
 class LongFormAudioPlan(BaseModel):
-    voice_id: str
-    segments: list[LongFormSegment]
+    voice_id: NonEmptyStr
+    segments: list[LongFormSegment] = Field(..., min_length=1)
     total_segments: int = Field(..., ge=1)
     total_estimated_duration_seconds: float = Field(..., ge=0.0)
     stitching_instructions: StitchingInstructions
 
     @model_validator(mode="after")
     def _validate_plan(self) -> "LongFormAudioPlan":
-        self.voice_id = self.voice_id.strip()
-        if not self.voice_id:
-            raise ValueError("voice_id cannot be empty")
-        if not self.segments:
-            raise ValueError("segments cannot be empty")
         if self.total_segments != len(self.segments):
             self.total_segments = len(self.segments)
         return self
 
 
 class LongFormAudioRequest(BaseModel):
-    script: str | None = Field(
+    script: OptionalStr = Field(
         default=None,
         description="Long-form narration script (legacy mode; prefer structured scenes)",
     )
     scenes: list[LongFormSceneInput] | None = Field(
         default=None,
+        min_length=1,
         description="Ordered list of narration scenes with optional pauses",
     )
-    voice_id: str | None = Field(
+    voice_id: OptionalStr = Field(
         default=None,
         description="Optional override for the generated voice id",
     )
-    filename_prefix: str | None = Field(
+    filename_prefix: OptionalStr = Field(
         default=None,
         description="Optional prefix applied to generated audio filenames",
     )
 
     @model_validator(mode="after")
     def _normalize_fields(self) -> "LongFormAudioRequest":
-        if self.script is not None:
-            script = self.script.strip()
-            self.script = script or None
-        if self.scenes is not None and len(self.scenes) == 0:
-            raise ValueError("scenes cannot be empty")
         if self.script is None and not self.scenes:
             raise ValueError("Either script or scenes must be provided")
-        if self.voice_id is not None:
-            voice = self.voice_id.strip()
-            self.voice_id = voice or None
-        if self.filename_prefix is not None:
-            prefix = self.filename_prefix.strip()
-            self.filename_prefix = prefix or None
         return self
 
 
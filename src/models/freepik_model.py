@@ -5,12 +5,14 @@ from __future__ import annotations
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl, model_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
 
 
 class TrajectoryPoint(BaseModel):
     """Represents a single (x, y) path coordinate for motion brushes."""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     x: int = Field(description="Horizontal coordinate in pixels")
     y: int = Field(description="Vertical coordinate in pixels")
 
@@ -18,6 +20,8 @@ class TrajectoryPoint(BaseModel):
 class DynamicMask(BaseModel):
     """Dynamic mask definition accepted by the Kling API."""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     mask: str = Field(description="Base64 encoded image or publicly accessible URL")
     trajectories: list[TrajectoryPoint] = Field(
         default_factory=list,
@@ -171,7 +175,8 @@ class FreepikTaskStatus(BaseModel):
     status: Literal["CREATED", "IN_PROGRESS", "COMPLETED", "FAILED"] = Field(
         description="Current processing status reported by Freepik",
     )
-    generated: list[HttpUrl] = Field(
+    # Echoed from Freepik as-is; HttpUrl would re-parse and normalize each signed URL.
+    generated: list[str] = Field(
         default_factory=list,
         description="Collection of generated asset URLs when the task completes",
     )
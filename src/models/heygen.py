@@ -2,16 +2,94 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import re
+from typing import Annotated, Any, Literal
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    model_validator,
+)
+
+from models.common import NonEmptyStr, StrippedStr
+
+
+def _lowercase(value: object) -> object:
+    return value.lower() if isinstance(value, str) else value
+
+
+# Lower-cased before the literal check so "Portrait" or "COVER" are accepted as well.
+VideoOrientation = Annotated[Literal["portrait", "landscape"], BeforeValidator(_lowercase)]
+VideoFit = Annotated[Literal["cover", "contain"], BeforeValidator(_lowercase)]
+
+
+DEFAULT_BACKGROUND_COLOR = "#FFFFFF"
+_HEX_COLOR_PATTERN = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+# The basic CSS colour keywords, which agents use in place of hex values.
+_NAMED_COLORS = {
+    "black": "#000000",
+    "silver": "#C0C0C0",
+    "gray": "#808080",
+    "grey": "#808080",
+    "white": "#FFFFFF",
+    "maroon": "#800000",
+    "red": "#FF0000",
+    "purple": "#800080",
+    "fuchsia": "#FF00FF",
+    "magenta": "#FF00FF",
+    "green": "#008000",
+    "lime": "#00FF00",
+    "olive": "#808000",
+    "yellow": "#FFFF00",
+    "navy": "#000080",
+    "blue": "#0000FF",
+    "teal": "#008080",
+    "aqua": "#00FFFF",
+    "cyan": "#00FFFF",
+    "orange": "#FFA500",
+}
+
+
+def _hex_color(value: object) -> object:
+    """Map colour names to hex and anything unrecognised to the default background."""
+
+    if not isinstance(value, str):
+        return value
+    color = value.strip()
+    if _HEX_COLOR_PATTERN.match(color):
+        return color
+    return _NAMED_COLORS.get(color.lower().replace(" ", ""), DEFAULT_BACKGROUND_COLOR)
+
+
+class HeyGenColorBackground(BaseModel):
+    """Solid color background for HeyGen videos."""
+
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+    type: Literal["color"] = Field(description="Background type")
+    value: Annotated[str, BeforeValidator(_hex_color)] = Field(
+        pattern=_HEX_COLOR_PATTERN.pattern,
+        description="Hex color value, e.g. #FFFFFF",
+    )
+
+
+class HeyGenImageBackground(BaseModel):
+    """Image background for HeyGen videos."""
 
-from pydantic import BaseModel, Field, model_validator
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
 
+    type: Literal["image"] = Field(description="Background type")
+    value: NonEmptyStr = Field(description="HeyGen image asset reference")
 
-class HeyGenBackground(BaseModel):
-    """Background configuration for HeyGen videos."""
 
-    type: Literal["color", "image"] = Field(description="Background type (color or image)")
-    value: str = Field(description="Hex color value or asset reference")
+# Tagged on ``type`` so pydantic-core picks the variant directly instead of trying each.
+HeyGenBackground = Annotated[
+    HeyGenColorBackground | HeyGenImageBackground,
+    Field(discriminator="type"),
+]
 
 
 class HeyGenSceneConfig(BaseModel):
@@ -32,7 +110,7 @@ class HeyGenSceneConfig(BaseModel):
     @model_validator(mode="after")
     def apply_defaults(self) -> HeyGenSceneConfig:
         if self.background is None:
-            self.background = HeyGenBackground(type="color", value="#FFFFFF")
+            self.background = HeyGenColorBackground(type="color", value=DEFAULT_BACKGROUND_COLOR)
         return self
 
 
@@ -42,6 +120,63 @@ class HeyGenStructuredOutput(BaseModel):
     scenes: list[HeyGenSceneConfig] = Field(default_factory=list)
 
 
+class HeyGenDimension(BaseModel):
+    """Output resolution requested from HeyGen."""
+
+    width: int
+    height: int
+
+
+class HeyGenCharacter(BaseModel):
+    """Talking photo rendered in a HeyGen video input."""
+
+    type: Literal["talking_photo"]
+    talking_photo_id: str
+
+
+class HeyGenVoice(BaseModel):
+    """Uploaded audio asset that drives a HeyGen video input."""
+
+    type: Literal["audio"]
+    audio_asset_id: str
+
+
+class HeyGenVideoInput(BaseModel):
+    """Single character/voice pairing submitted to HeyGen."""
+
+    character: HeyGenCharacter
+    voice: HeyGenVoice
+
+
+class HeyGenRequestPayload(BaseModel):
+    """Body submitted to the HeyGen video generation endpoint."""
+
+    dimension: HeyGenDimension
+    video_inputs: list[HeyGenVideoInput]
+
+
+class HeyGenStatusData(BaseModel):
+    """``data`` section of a HeyGen video status response."""
+
+    # Undocumented fields are kept so the raw status stays useful for troubleshooting.
+    model_config = ConfigDict(extra="allow")
+
+    status: str | None = None
+    video_url: str | None = None
+    thumbnail_url: str | None = None
+    error: Any = None
+
+
+class HeyGenStatusDetail(BaseModel):
+    """HeyGen video status response envelope."""
+
+    model_config = ConfigDict(extra="allow")
+
+    code: int | None = None
+    message: str | None = None
+    data: HeyGenStatusData | None = None
+
+
 class HeyGenVideoResult(BaseModel):
     """Result of requesting a HeyGen video generation job."""
 
@@ -55,8 +190,8 @@ class HeyGenVideoResult(BaseModel):
         default=None, description="Thumbnail image URL for the generated video"
     )
     message: str | None = None
-    request_payload: dict[str, Any] | None = None
-    status_detail: dict[str, Any] | None = Field(
+    request_payload: HeyGenRequestPayload | None = None
+    status_detail: HeyGenStatusDetail | None = Field(
         default=None,
         description="Raw payload returned by HeyGen video_status.get for troubleshooting",
     )
@@ -90,37 +225,23 @@ class HeyGenVideoResponse(BaseModel):
 class HeyGenAvatarAgentOutput(BaseModel):
     """Structured fields required for HeyGen Avatar IV generation."""
 
-    video_title: str = Field(..., max_length=80)
-    script: str = Field(..., min_length=20, max_length=2000)
-    voice_id: str = Field(..., min_length=3, max_length=100)
-    video_orientation: Literal["portrait", "landscape"] = Field(default="portrait")
-    fit: Literal["cover", "contain"] = Field(default="cover")
-    custom_motion_prompt: str = Field(..., max_length=500)
+    video_title: NonEmptyStr = Field(..., max_length=80)
+    script: NonEmptyStr = Field(..., min_length=20, max_length=2000)
+    voice_id: NonEmptyStr = Field(..., min_length=3, max_length=100)
+    video_orientation: VideoOrientation = Field(default="portrait")
+    fit: VideoFit = Field(default="cover")
+    custom_motion_prompt: NonEmptyStr = Field(..., max_length=500)
     enhance_custom_motion_prompt: bool = Field(default=True)
 
-    @model_validator(mode="after")
-    def _normalize_fields(self) -> HeyGenAvatarAgentOutput:
-        self.video_title = self.video_title.strip()
-        self.script = self.script.strip()
-        self.voice_id = self.voice_id.strip()
-        self.custom_motion_prompt = self.custom_motion_prompt.strip()
-        if not self.video_title:
-            raise ValueError("video_title cannot be empty")
-        if not self.script:
-            raise ValueError("script cannot be empty")
-        if not self.voice_id:
-            raise ValueError("voice_id cannot be empty")
-        if not self.custom_motion_prompt:
-            raise ValueError("custom_motion_prompt cannot be empty")
-        return self
-
 
 class HeyGenAvatarVideoRequest(BaseModel):
     """Request body for generating an Avatar IV video."""
 
     image_asset_id: str = Field(..., description="Image key returned by HeyGen asset upload API")
-    script: str = Field(..., min_length=10, description="Narration text the avatar should speak")
-    video_brief: str | None = Field(
+    script: Annotated[str, StringConstraints(strip_whitespace=True, min_length=10)] = Field(
+        ..., description="Narration text the avatar should speak"
+    )
+    video_brief: StrippedStr | None = Field(
         default=None,
         description="Optional high-level creative brief supplied to the agent",
     )
@@ -128,8 +249,8 @@ class HeyGenAvatarVideoRequest(BaseModel):
         default=None,
         description="Voice attributes or preferred HeyGen voice id",
     )
-    orientation_hint: Literal["portrait", "landscape"] | None = Field(default=None)
-    fit_hint: Literal["cover", "contain"] | None = Field(default=None)
+    orientation_hint: VideoOrientation | None = Field(default=None)
+    fit_hint: VideoFit | None = Field(default=None)
     enhance_motion_override: bool | None = Field(default=None)
     force_upload_audio: bool = Field(
         default=False,
@@ -138,31 +259,49 @@ class HeyGenAvatarVideoRequest(BaseModel):
 
     @model_validator(mode="after")
     def _normalize_fields(self) -> HeyGenAvatarVideoRequest:
-        self.script = self.script.strip()
-        if not self.script:
-            raise ValueError("script cannot be empty")
+        self.video_brief = self.video_brief or self.script
+        return self
 
-        if self.video_brief is not None:
-            brief = self.video_brief.strip()
-            self.video_brief = brief or self.script
-        else:
-            self.video_brief = self.script
 
-        if self.orientation_hint:
-            self.orientation_hint = self.orientation_hint.lower()  # type: ignore[assignment]
-        if self.fit_hint:
-            self.fit_hint = self.fit_hint.lower()  # type: ignore[assignment]
+class HeyGenAvatarRequestPayload(BaseModel):
+    """Body submitted to the HeyGen Avatar IV endpoint."""
 
-        return self
+    image_key: str
+    video_title: str
+    video_orientation: VideoOrientation
+    fit: VideoFit
+    custom_motion_prompt: str
+    enhance_custom_motion_prompt: bool
+    audio_asset_id: str | None = None
+    script: str
+    voice_id: str
+
+
+class HeyGenAvatarJobData(BaseModel):
+    """``data`` section returned when an Avatar IV job is accepted."""
+
+    model_config = ConfigDict(extra="allow")
+
+    video_id: str | None = None
+
+
+class HeyGenAvatarJob(BaseModel):
+    """HeyGen Avatar IV submission response envelope."""
+
+    model_config = ConfigDict(extra="allow")
+
+    code: int | None = None
+    message: str | None = None
+    data: HeyGenAvatarJobData | None = None
 
 
 class HeyGenAvatarVideoResponse(BaseModel):
     """Response payload for Avatar IV video generation."""
 
     status: Literal["success", "failed"]
-    job: dict[str, Any] = Field(default_factory=dict)
+    job: HeyGenAvatarJob = Field(default_factory=HeyGenAvatarJob)
     prompts: HeyGenAvatarAgentOutput | None = None
     audio_asset_id: str | None = None
     audio_reference: str | None = None
-    request_payload: dict[str, Any] | None = Field(default=None)
+    request_payload: HeyGenAvatarRequestPayload | None = Field(default=None)
     errors: list[str] = Field(default_factory=list)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LongformScenesRequest(BaseModel):
@@ -17,11 +17,19 @@ class LongformScenesRequest(BaseModel):
 class SegmentPausePlan(BaseModel):
     """Represents a single sentence and the pause that should follow it."""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     text: str = Field(..., description="Exact sentence text with explicit pause markers removed.")
     pause_after_seconds: float = Field(
         ..., ge=0.0, description="Pause duration to insert after this sentence, in seconds."
     )
 
+    @property
+    def pause_after_ms(self) -> int:
+        """Pause rounded to whole milliseconds, the unit audio splicing works in."""
+
+        return int(round(self.pause_after_seconds * 1000))
+
 
 class SceneProcessingSummary(BaseModel):
     """Metadata returned for each processed scene."""
@@ -32,7 +40,7 @@ class SceneProcessingSummary(BaseModel):
         description="Ordered sentence segmentation and pauses for the scene.",
     )
     processed_audio_path: str = Field(
-        ..., description="Data URL or temporary path referencing the processed scene audio."
+        ..., description="cid: reference to the multipart part carrying the processed scene audio."
     )
     timing_analysis: SceneTimingAnalysis | None = Field(
         default=None,
@@ -49,13 +57,15 @@ class LongformScenesResponse(BaseModel):
     )
     final_audio_path: str = Field(
         ...,
-        description="Data URL or temporary path referencing the fully stitched audio.",
+        description="cid: reference to the multipart part carrying the fully stitched audio.",
     )
 
 
 class TranscriptSegment(BaseModel):
     """Single Whisper transcription chunk with timestamps."""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     text: str = Field(..., description="Auto-transcribed text snippet.")
     start_ms: int = Field(..., ge=0, description="Start timestamp in milliseconds.")
     end_ms: int = Field(..., ge=0, description="End timestamp in milliseconds.")
@@ -64,6 +74,8 @@ class TranscriptSegment(BaseModel):
 class SilenceWindow(BaseModel):
     """Silence span detected by VAD."""
 
+    model_config = ConfigDict(frozen=True)
+
     start_ms: int = Field(..., ge=0, description="Silence start in milliseconds.")
     end_ms: int = Field(..., ge=0, description="Silence end in milliseconds.")
     duration_ms: int = Field(..., ge=0, description="Total silence duration in milliseconds.")
@@ -72,6 +84,8 @@ class SilenceWindow(BaseModel):
 class SegmentTimingReport(BaseModel):
     """Comparison of expected vs measured sentence timing."""
 
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     expected_text: str = Field(..., description="Sentence text requested from plan.")
     expected_pause_seconds: float = Field(..., ge=0.0)
     measured_start_ms: int | None = Field(
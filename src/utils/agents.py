@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from pydantic_ai import Agent
@@ -19,50 +20,53 @@ LONGFORM_SPLICE_PROMPT_PATH = PROMPTS_DIR / "longform_splice_prompt.md"
 LONGFORM_CLAUSE_PROMPT_PATH = PROMPTS_DIR / "longform_clause_prompt.md"
 
 
+@functools.cache
 def load_prompt(path: Path) -> str:
-    with path.open(encoding="utf-8") as prompt_file:
-        return prompt_file.read()
-
-
-provider = OpenAIProvider(api_key=settings.OPENAI_API_KEY)
-
-model = OpenAIChatModel(model_name="gpt-5", provider=provider)
-
-# Agent for Eleven Labs
-audio_agent = Agent(model=model, system_prompt=load_prompt(ELEVENLABS_PROMPT_PATH))
-
-# Agent for Eleven Labs long-form narration
-longform_audio_agent = Agent(
-    model=model,
-    system_prompt=load_prompt(ELEVENLABS_LONGFORM_PROMPT_PATH),
-)
-
-# Agent to sanitize raw meditation scripts before TTS
-longform_sanitizer_agent = Agent(
-    model=model,
-    system_prompt=load_prompt(LONGFORM_SANITIZER_PROMPT_PATH),
-)
-
-# Agent to evaluate generated audio pauses and propose splice adjustments
-longform_splice_agent = Agent(
-    model=model,
-    system_prompt=load_prompt(LONGFORM_SPLICE_PROMPT_PATH),
-)
-
-# Agent to normalize clause-level segmentation when regex fallback is unreliable
-longform_clause_agent = Agent(
-    model=model,
-    system_prompt=load_prompt(LONGFORM_CLAUSE_PROMPT_PATH),
-)
-
-# Agent for Heygen
-heygen_agent = Agent(model=model, system_prompt=load_prompt(HEYGEN_PROMPT_PATH))
-
-# Agent for Freepik Kling
-freepik_agent = Agent(model=model, system_prompt=load_prompt(FREEPIK_PROMPT_PATH))
-
-# Agent for HeyGen Avatar IV
-heygen_avatar_agent = Agent(model=model, system_prompt=load_prompt(HEYGEN_AVATAR_PROMPT_PATH))
-
-# Agent for Creatomate payload preparation
-creatomate_agent = Agent(model=model, system_prompt=load_prompt(CREATOMATE_PROMPT_PATH))
+    """Read a prompt file once per process; repeated loads reuse the cached text."""
+
+    return path.read_text(encoding="utf-8")
+
+
+# Prompt backing each agent; agents are built on first access by ``__getattr__``.
+_AGENT_PROMPT_PATHS: dict[str, Path] = {
+    # Agent for Eleven Labs
+    "audio_agent": ELEVENLABS_PROMPT_PATH,
+    # Agent for Eleven Labs long-form narration
+    "longform_audio_agent": ELEVENLABS_LONGFORM_PROMPT_PATH,
+    # Agent to sanitize raw meditation scripts before TTS
+    "longform_sanitizer_agent": LONGFORM_SANITIZER_PROMPT_PATH,
+    # Agent to evaluate generated audio pauses and propose splice adjustments
+    "longform_splice_agent": LONGFORM_SPLICE_PROMPT_PATH,
+    # Agent to normalize clause-level segmentation when regex fallback is unreliable
+    "longform_clause_agent": LONGFORM_CLAUSE_PROMPT_PATH,
+    # Agent for Heygen
+    "heygen_agent": HEYGEN_PROMPT_PATH,
+    # Agent for Freepik Kling
+    "freepik_agent": FREEPIK_PROMPT_PATH,
+    # Agent for HeyGen Avatar IV
+    "heygen_avatar_agent": HEYGEN_AVATAR_PROMPT_PATH,
+    # Agent for Creatomate payload preparation
+    "creatomate_agent": CREATOMATE_PROMPT_PATH,
+}
+
+
+@functools.cache
+def _chat_model() -> OpenAIChatModel:
+    provider = OpenAIProvider(api_key=settings.OPENAI_API_KEY)
+    return OpenAIChatModel(model_name="gpt-5", provider=provider)
+
+
+def __getattr__(name: str) -> Agent:
+    """Build an agent on first access and memoize it as a module attribute (PEP 562)."""
+
+    prompt_path = _AGENT_PROMPT_PATHS.get(name)
+    if prompt_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    agent = Agent(model=_chat_model(), system_prompt=load_prompt(prompt_path))
+    globals()[name] = agent
+    return agent
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_AGENT_PROMPT_PATHS])
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
 import logging
+import os
+import tempfile
+import threading
 from collections.abc import Mapping, Sequence
+from itertools import pairwise
+from pathlib import Path
 from typing import Any
 
+import httpx
+import numpy as np
 import webrtcvad
-from openai import AsyncOpenAI, OpenAIError
+from fastapi.concurrency import run_in_threadpool
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAIError
+from pydantic import TypeAdapter, ValidationError
 from pydub import AudioSegment
 
 from config.config import settings
@@ -22,12 +33,36 @@ from models.longform import (
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_WHISPER_MODEL = "gpt-4o-mini-transcribe"
+# Only whisper-1 returns timestamped segments (verbose_json); the gpt-4o transcribe models
+# answer with bare text, which leaves nothing to align against the plan.
+DEFAULT_WHISPER_MODEL = "whisper-1"
 VAD_SAMPLE_RATE = 16_000
 VAD_FRAME_MS = 30
 MIN_SILENCE_MS = 400
+VAD_SILENT_FRAME_RMS = 32.0
+WHISPER_UPLOAD_SAMPLE_RATE = 16_000
+WHISPER_UPLOAD_MAX_SAMPLE_RATE = 24_000
+WHISPER_UPLOAD_BITRATE = "16k"
+WHISPER_UPLOAD_CONTENT_TYPES = {"mp3": "audio/mpeg", "ogg": "audio/ogg"}
+WHISPER_CHUNK_THRESHOLD_MS = 120_000
+WHISPER_CHUNK_TARGET_MS = 60_000
+WHISPER_CACHE_PRUNE_INTERVAL = 64
+# Rate limits, timeouts, connection drops and 5xx are retried with jittered backoff by the SDK.
+WHISPER_MAX_RETRIES = 3
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
 
 _openai_client: AsyncOpenAI | None = None
+_whisper_semaphore = asyncio.Semaphore(settings.MAX_WHISPER_CONCURRENCY)
+# Transcriptions in flight keyed by audio digest, so identical audio is sent only once.
+_whisper_inflight: dict[bytes, asyncio.Task[list[TranscriptSegment]]] = {}
+_whisper_cache_writes = 0
+# Chunked transcription is only worth paying for once Whisper has returned segments.
+_whisper_segments_confirmed = False
+_whisper_cache_writes_lock = threading.Lock()
+
+# Whole batches are validated in one pydantic-core call instead of one model per item.
+_TRANSCRIPT_SEGMENTS = TypeAdapter(list[TranscriptSegment])
+_SILENCE_WINDOWS = TypeAdapter(list[SilenceWindow])
 
 
 def _ensure_async_openai() -> AsyncOpenAI:
@@ -35,19 +70,27 @@ def _ensure_async_openai() -> AsyncOpenAI:
     if _openai_client is None:
         if not settings.OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is required for Whisper analysis.")
-        _openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            max_retries=WHISPER_MAX_RETRIES,
+            http_client=DefaultAsyncHttpxClient(limits=OPENAI_HTTP_LIMITS),
+        )
     return _openai_client
 
 
+async def close_openai_client() -> None:
+    """Close the pooled Whisper client; called on application shutdown."""
+
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+
 def _extract_segments_payload(response: object) -> list[Any]:
+    # SDK models expose ``segments`` as an attribute (typed or extra), so no to_dict() copy.
     segments = getattr(response, "segments", None)
-    if segments is None:
-        to_dict = getattr(response, "to_dict", None)
-        if callable(to_dict):
-            mapping = to_dict()
-            if isinstance(mapping, Mapping):
-                segments = mapping.get("segments")
-    if segments is None and isinstance(response, dict):
+    if segments is None and isinstance(response, Mapping):
         segments = response.get("segments")
     return segments if isinstance(segments, list) else []
 
@@ -67,24 +110,167 @@ def _coerce_to_str(value: Any) -> str:
     return str(value)
 
 
-async def _transcribe_with_whisper(audio_bytes: bytes) -> list[TranscriptSegment]:
-    """Run Whisper transcription via OpenAI and return timestamped segments."""
+def _whisper_cache_key(*parts: bytes) -> bytes:
+    # Keyed by model as well, so switching models never serves a stale cached transcript.
+    hasher = hashlib.blake2b(digest_size=16, key=DEFAULT_WHISPER_MODEL.encode())
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+
+async def _transcribe_with_whisper(
+    audio_bytes: bytes,
+    segment: AudioSegment | None = None,
+    upload_format: str = "mp3",
+    key: bytes | None = None,
+) -> list[TranscriptSegment]:
+    """Run Whisper transcription via OpenAI and return timestamped segments.
+
+    ``key`` identifies the audio for the in-flight and on-disk caches; it defaults to a
+    digest of ``audio_bytes``.
+    """
 
     if not settings.OPENAI_API_KEY:
         logger.warning("Skipping Whisper transcription because OPENAI_API_KEY is missing.")
         return []
 
+    if key is None:
+        key = _whisper_cache_key(audio_bytes)
+    task = _whisper_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _cached_whisper_segments(key, audio_bytes, segment, upload_format)
+        )
+        _whisper_inflight[key] = task
+        task.add_done_callback(lambda _: _whisper_inflight.pop(key, None))
+
+    # Shielded so one cancelled caller does not abort the request for the others.
+    return list(await asyncio.shield(task))
+
+
+async def _cached_whisper_segments(
+    key: bytes,
+    audio_bytes: bytes,
+    segment: AudioSegment | None,
+    upload_format: str,
+) -> list[TranscriptSegment]:
+    """Serve a transcript from the on-disk cache, transcribing and storing it on a miss."""
+
+    cache_path = _whisper_cache_path(key)
+    if cache_path is not None:
+        cached = await run_in_threadpool(_read_cached_transcript, cache_path)
+        if cached is not None:
+            return cached
+
+    segments = await _request_whisper_segments(audio_bytes, segment, upload_format)
+    # Empty results are not cached: failed requests also come back empty.
+    if cache_path is not None and segments:
+        try:
+            await run_in_threadpool(_write_cached_transcript, cache_path, segments)
+        except OSError as error:
+            logger.warning("Unable to cache Whisper transcript at %s: %s", cache_path, error)
+    return segments
+
+
+def _whisper_cache_path(key: bytes) -> Path | None:
+    if not settings.WHISPER_CACHE_DIR:
+        return None
+    digest = key.hex()
+    return Path(settings.WHISPER_CACHE_DIR) / digest[:2] / f"{digest}.json"
+
+
+def _read_cached_transcript(path: Path) -> list[TranscriptSegment] | None:
+    try:
+        segments = _TRANSCRIPT_SEGMENTS.validate_json(path.read_bytes())
+        # Refresh the timestamp so pruning evicts the least recently used entries first.
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as error:
+        logger.warning("Ignoring unreadable Whisper cache entry %s: %s", path, error)
+        return None
+    return segments
+
+
+def _write_cached_transcript(path: Path, segments: list[TranscriptSegment]) -> None:
+    global _whisper_cache_writes
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as handle:
+        handle.write(_TRANSCRIPT_SEGMENTS.dump_json(segments))
+    # Readers only ever see a complete entry.
+    Path(handle.name).replace(path)
+
+    # Writes land on threadpool workers, so the counter is only touched under the lock.
+    with _whisper_cache_writes_lock:
+        _whisper_cache_writes += 1
+        prune_due = _whisper_cache_writes % WHISPER_CACHE_PRUNE_INTERVAL == 0
+    if prune_due:
+        _prune_whisper_cache(path.parent.parent)
+
+
+def _prune_whisper_cache(cache_dir: Path) -> None:
+    """Drop the least recently used entries beyond ``WHISPER_CACHE_MAX_ENTRIES``."""
+
+    entries: list[tuple[float, Path]] = []
+    for entry in cache_dir.glob("*/*.json"):
+        try:
+            entries.append((entry.stat().st_mtime, entry))
+        except FileNotFoundError:
+            continue
+
+    excess = len(entries) - settings.WHISPER_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, entry in entries[:excess]:
+        entry.unlink(missing_ok=True)
+
+
+def _encode_whisper_upload(segment: AudioSegment) -> bytes:
+    """Re-encode ``segment`` as low-bitrate 16 kHz mono Opus for a smaller upload."""
+
+    buffer = io.BytesIO()
+    segment.set_frame_rate(WHISPER_UPLOAD_SAMPLE_RATE).set_channels(1).export(
+        buffer,
+        format="ogg",
+        codec="libopus",
+        bitrate=WHISPER_UPLOAD_BITRATE,
+    )
+    return buffer.getvalue()
+
+
+async def _request_whisper_segments(
+    audio_bytes: bytes,
+    segment: AudioSegment | None = None,
+    upload_format: str = "mp3",
+) -> list[TranscriptSegment]:
     client = _ensure_async_openai()
-    buffer = io.BytesIO(audio_bytes)
-    buffer.name = "scene.mp3"
+    upload = audio_bytes
+
+    # Whisper only needs 16 kHz mono, so wider sources are shrunk before upload.
+    if segment is not None and (
+        segment.frame_rate > WHISPER_UPLOAD_MAX_SAMPLE_RATE or segment.channels > 1
+    ):
+        try:
+            upload = await run_in_threadpool(_encode_whisper_upload, segment)
+            upload_format = "ogg"
+        except Exception as error:  # pragma: no cover - ffmpeg failure
+            logger.warning("Unable to compress Whisper upload, sending original audio: %s", error)
 
     try:
-        response = await client.audio.transcriptions.create(
-            model=DEFAULT_WHISPER_MODEL,
-            file=buffer,
-            response_format="json",
-            temperature=0,
-        )
+        async with _whisper_semaphore:
+            response = await client.audio.transcriptions.create(
+                model=DEFAULT_WHISPER_MODEL,
+                file=(
+                    f"scene.{upload_format}",
+                    upload,
+                    WHISPER_UPLOAD_CONTENT_TYPES[upload_format],
+                ),
+                response_format="verbose_json",
+                timestamp_granularities=["segment"],
+                temperature=0,
+            )
     except OpenAIError as error:
         logger.warning("Whisper transcription failed: %s", error)
         return []
@@ -92,7 +278,8 @@ async def _transcribe_with_whisper(audio_bytes: bytes) -> list[TranscriptSegment
         logger.warning("Unexpected Whisper transcription error: %s", error)
         return []
 
-    segments: list[TranscriptSegment] = []
+    texts: list[str] = []
+    bounds_seconds: list[tuple[float, float]] = []
     for raw_segment in _extract_segments_payload(response):
         text_value = _segment_field(raw_segment, "text", default="")
         text = _coerce_to_str(text_value).strip()
@@ -100,15 +287,104 @@ async def _transcribe_with_whisper(audio_bytes: bytes) -> list[TranscriptSegment
             continue
         start = _coerce_to_float(_segment_field(raw_segment, "start", default=0.0), 0.0)
         end = _coerce_to_float(_segment_field(raw_segment, "end", default=start), start)
-        segments.append(
-            TranscriptSegment(
-                text=text,
-                start_ms=max(int(round(start * 1000)), 0),
-                end_ms=max(int(round(end * 1000)), 0),
+        texts.append(text)
+        bounds_seconds.append((start, end))
+
+    if not texts:
+        return []
+
+    # One rounding pass for every timestamp; np.rint rounds half to even like round().
+    bounds_ms = np.maximum(np.rint(np.asarray(bounds_seconds) * 1000), 0).astype(np.int64)
+    segments = [
+        {"text": text, "start_ms": start_ms, "end_ms": end_ms}
+        for text, (start_ms, end_ms) in zip(texts, bounds_ms.tolist(), strict=True)
+    ]
+
+    global _whisper_segments_confirmed
+    _whisper_segments_confirmed = True
+    return _TRANSCRIPT_SEGMENTS.validate_python(segments)
+
+
+def _whisper_chunk_bounds(total_ms: int, silence_windows: Sequence[SilenceWindow]) -> list[int]:
+    """Return chunk boundaries cut mid-silence roughly every ``WHISPER_CHUNK_TARGET_MS``."""
+
+    bounds = [0]
+    for window in silence_windows:
+        cut = (window.start_ms + window.end_ms) // 2
+        if (
+            cut - bounds[-1] >= WHISPER_CHUNK_TARGET_MS
+            and total_ms - cut >= WHISPER_CHUNK_TARGET_MS // 2
+        ):
+            bounds.append(cut)
+    bounds.append(total_ms)
+    return bounds
+
+
+def _is_silent_span(start_ms: int, end_ms: int, silence_windows: Sequence[SilenceWindow]) -> bool:
+    """Whether VAD silence covers the span, give or take one VAD frame."""
+
+    covered_ms = sum(
+        max(min(window.end_ms, end_ms) - max(window.start_ms, start_ms), 0)
+        for window in silence_windows
+    )
+    return covered_ms >= end_ms - start_ms - VAD_FRAME_MS
+
+
+def _encode_whisper_chunks(segment: AudioSegment, bounds: Sequence[int]) -> list[bytes]:
+    return [_encode_whisper_upload(segment[start:end]) for start, end in pairwise(bounds)]
+
+
+async def _transcribe_in_chunks(
+    audio_bytes: bytes,
+    segment: AudioSegment,
+    silence_windows: Sequence[SilenceWindow],
+) -> list[TranscriptSegment]:
+    """Transcribe a long scene as concurrent silence-aligned chunks and stitch the timeline."""
+
+    bounds = _whisper_chunk_bounds(len(segment), silence_windows)
+    if len(bounds) <= 2:
+        return await _transcribe_with_whisper(audio_bytes, segment)
+
+    try:
+        uploads = await run_in_threadpool(_encode_whisper_chunks, segment, bounds)
+    except Exception as error:  # pragma: no cover - ffmpeg failure
+        logger.warning("Unable to chunk Whisper upload, sending whole scene: %s", error)
+        return await _transcribe_with_whisper(audio_bytes, segment)
+
+    # ffmpeg's Ogg output is not byte-stable between runs, so chunks are keyed on the
+    # scene audio and their bounds rather than on the encoded upload.
+    scene_key = _whisper_cache_key(audio_bytes)
+    chunk_results = await asyncio.gather(
+        *(
+            _transcribe_with_whisper(
+                upload,
+                upload_format="ogg",
+                key=_whisper_cache_key(scene_key, f"{start_ms}-{end_ms}".encode()),
             )
+            for upload, (start_ms, end_ms) in zip(uploads, pairwise(bounds), strict=True)
         )
+    )
 
-    return segments
+    # Reports pair transcript segments with the plan by index, so a chunk lost to a failed
+    # request would misalign every later report; transcribe the whole scene instead.
+    for (start_ms, end_ms), chunk_segments in zip(pairwise(bounds), chunk_results, strict=True):
+        if not chunk_segments and not _is_silent_span(start_ms, end_ms, silence_windows):
+            logger.warning(
+                "Whisper returned nothing for chunk %d-%d ms; transcribing whole scene",
+                start_ms,
+                end_ms,
+            )
+            return await _transcribe_with_whisper(audio_bytes, segment)
+
+    transcript: list[TranscriptSegment] = []
+    for offset_ms, chunk_segments in zip(bounds[:-1], chunk_results, strict=True):
+        transcript.extend(
+            item.model_copy(
+                update={"start_ms": item.start_ms + offset_ms, "end_ms": item.end_ms + offset_ms}
+            )
+            for item in chunk_segments
+        )
+    return transcript
 
 
 def _segment_field(segment: object, key: str, default: Any) -> Any:
@@ -117,78 +393,76 @@ def _segment_field(segment: object, key: str, default: Any) -> Any:
     return getattr(segment, key, default)
 
 
-def _decode_audio(audio_bytes: bytes) -> AudioSegment:
-    audio = AudioSegment.from_file(io.BytesIO(audio_bytes))
-    return audio.set_frame_rate(VAD_SAMPLE_RATE).set_channels(1).set_sample_width(2)
+def _decode_pcm(
+    audio_bytes: bytes,
+    segment: AudioSegment | None = None,
+) -> tuple[np.ndarray, int]:
+    """Return 16 kHz mono int16 samples and the duration in milliseconds.
+
+    An already-decoded ``segment`` is resampled in-process, skipping the ffmpeg decode.
+    """
+
+    if segment is None:
+        segment = AudioSegment.from_file(io.BytesIO(audio_bytes))
+    mono_audio = segment.set_frame_rate(VAD_SAMPLE_RATE).set_channels(1).set_sample_width(2)
+    return np.frombuffer(mono_audio.raw_data, dtype=np.int16), len(mono_audio)
 
 
-def _detect_vad_silence(audio_bytes: bytes) -> list[SilenceWindow]:
+def _detect_vad_silence(
+    audio_bytes: bytes,
+    segment: AudioSegment | None = None,
+) -> list[SilenceWindow]:
     """Return silence windows detected by WebRTC VAD."""
 
     try:
-        mono_audio = _decode_audio(audio_bytes)
+        samples, total_ms = _decode_pcm(audio_bytes, segment)
     except Exception as error:  # pragma: no cover - ffmpeg failure
         logger.warning("Unable to decode audio for VAD: %s", error)
         return []
 
-    pcm_data = mono_audio.raw_data
-    if pcm_data is None:
+    samples_per_frame = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000
+    frame_count = samples.size // samples_per_frame
+    if frame_count == 0:
         return []
 
-    sample_width = mono_audio.sample_width
-    frame_byte_length = int(VAD_SAMPLE_RATE * (VAD_FRAME_MS / 1000) * sample_width)
-    if frame_byte_length <= 0 or len(pcm_data) < frame_byte_length:
-        return []
+    frames = samples[: frame_count * samples_per_frame].reshape(frame_count, samples_per_frame)
+    # Integer sums of squares straight off the int16 view, with no full-size float temporary;
+    # comparing them against the squared RMS floor skips the sqrt as well.
+    frame_energy = np.einsum("ij,ij->i", frames, frames, dtype=np.int64)
+    audible = frame_energy >= VAD_SILENT_FRAME_RMS**2 * samples_per_frame
 
+    # Near-silent frames never reach WebRTC VAD; only the ambiguous ones are classified.
     vad = webrtcvad.Vad(2)
-    silence_windows: list[SilenceWindow] = []
-    silence_start_ms: int | None = None
-
-    for offset in range(0, len(pcm_data) - frame_byte_length + 1, frame_byte_length):
-        frame = pcm_data[offset : offset + frame_byte_length]
-        frame_start_ms = int(((offset // sample_width) / VAD_SAMPLE_RATE) * 1000)
-        is_speech = vad.is_speech(frame, VAD_SAMPLE_RATE)
-
-        if not is_speech:
-            if silence_start_ms is None:
-                silence_start_ms = frame_start_ms
-            continue
-
-        if silence_start_ms is not None:
-            duration = frame_start_ms - silence_start_ms
-            if duration >= MIN_SILENCE_MS:
-                silence_windows.append(
-                    SilenceWindow(
-                        start_ms=silence_start_ms,
-                        end_ms=frame_start_ms,
-                        duration_ms=duration,
-                    )
-                )
-            silence_start_ms = None
-
-    total_ms = len(mono_audio)
-    if silence_start_ms is not None:
-        duration = total_ms - silence_start_ms
-        if duration >= MIN_SILENCE_MS:
-            silence_windows.append(
-                SilenceWindow(
-                    start_ms=silence_start_ms,
-                    end_ms=total_ms,
-                    duration_ms=duration,
-                )
-            )
-
-    return silence_windows
-
-
-def _first_silence_after(
-    timestamp_ms: int,
-    windows: Sequence[SilenceWindow],
-) -> SilenceWindow | None:
-    for window in windows:
-        if window.start_ms >= timestamp_ms:
-            return window
-    return None
+    is_speech = np.zeros(frame_count, dtype=bool)
+    # Frames are handed to the VAD as zero-copy byte views into the decoded PCM.
+    pcm_view = memoryview(frames).cast("B")
+    frame_bytes = samples_per_frame * frames.itemsize
+    for index in np.flatnonzero(audible).tolist():
+        offset = index * frame_bytes
+        is_speech[index] = vad.is_speech(pcm_view[offset : offset + frame_bytes], VAD_SAMPLE_RATE)
+
+    # Silence runs start where the padded speech mask drops and end where it rises again.
+    edges = np.diff(np.concatenate(([True], is_speech, [True])).astype(np.int8))
+    run_starts = np.flatnonzero(edges == -1)
+    run_ends = np.flatnonzero(edges == 1)
+
+    starts_ms = run_starts * VAD_FRAME_MS
+    ends_ms = run_ends * VAD_FRAME_MS
+    if run_ends.size and run_ends[-1] == frame_count:
+        ends_ms[-1] = total_ms
+    durations_ms = ends_ms - starts_ms
+    keep = durations_ms >= MIN_SILENCE_MS
+
+    silence_windows = [
+        {"start_ms": start, "end_ms": end, "duration_ms": duration}
+        for start, end, duration in zip(
+            starts_ms[keep].tolist(),
+            ends_ms[keep].tolist(),
+            durations_ms[keep].tolist(),
+            strict=True,
+        )
+    ]
+    return _SILENCE_WINDOWS.validate_python(silence_windows)
 
 
 def _build_segment_reports(
@@ -197,6 +471,8 @@ def _build_segment_reports(
     silence_windows: Sequence[SilenceWindow],
 ) -> list[SegmentTimingReport]:
     reports: list[SegmentTimingReport] = []
+    # Both sequences are time ordered, so the trailing-silence cursor only moves forward.
+    window_index = 0
 
     for index, expected_segment in enumerate(expected):
         transcript_segment = transcript[index] if index < len(transcript) else None
@@ -205,9 +481,18 @@ def _build_segment_reports(
         measured_pause = None
         if transcript_segment and next_segment:
             measured_pause = max(0, next_segment.start_ms - transcript_segment.end_ms)
-
+        elif transcript_segment:
+            while (
+                window_index < len(silence_windows)
+                and silence_windows[window_index].start_ms < transcript_segment.end_ms
+            ):
+                window_index += 1
+            if window_index < len(silence_windows):
+                measured_pause = silence_windows[window_index].duration_ms
+
+        # Every field comes from an already validated plan or transcript segment.
         reports.append(
-            SegmentTimingReport(
+            SegmentTimingReport.model_construct(
                 expected_text=expected_segment.text,
                 expected_pause_seconds=expected_segment.pause_after_seconds,
                 measured_start_ms=transcript_segment.start_ms if transcript_segment else None,
@@ -216,31 +501,71 @@ def _build_segment_reports(
             )
         )
 
-    for report in reports:
-        if report.measured_pause_ms is not None or report.measured_end_ms is None:
-            continue
-        trailing = _first_silence_after(report.measured_end_ms, silence_windows)
-        if trailing:
-            report.measured_pause_ms = trailing.duration_ms
-
     return reports
 
 
 async def analyze_scene_audio(
     audio_bytes: bytes,
     expected_plan: Sequence[SegmentPausePlan],
+    segment: AudioSegment | None = None,
 ) -> SceneTimingAnalysis:
-    """Compute Whisper transcription + VAD pauses for a processed scene."""
+    """Compute Whisper transcription + VAD pauses for a processed scene.
+
+    Pass the decoded ``segment`` behind ``audio_bytes`` when it is at hand; VAD then skips
+    decoding and Whisper receives a compact 16 kHz upload.
+    """
 
     if not audio_bytes:
         return SceneTimingAnalysis()
 
-    transcript_segments = await _transcribe_with_whisper(audio_bytes)
-    silence_windows = _detect_vad_silence(audio_bytes)
+    if (
+        segment is not None
+        and settings.OPENAI_API_KEY
+        and _whisper_segments_confirmed
+        and len(segment) > WHISPER_CHUNK_THRESHOLD_MS
+    ):
+        # Long scenes need the VAD windows first to pick where Whisper chunks are cut.
+        try:
+            silence_windows = await run_in_threadpool(_detect_vad_silence, audio_bytes, segment)
+        except Exception as error:
+            logger.warning("VAD silence detection failed: %s", error)
+            silence_windows = []
+        try:
+            transcript_segments = await _transcribe_in_chunks(audio_bytes, segment, silence_windows)
+        except Exception as error:
+            logger.warning("Whisper transcription failed: %s", error)
+            transcript_segments = []
+        return _scene_timing_analysis(expected_plan, transcript_segments, silence_windows)
+
+    # Whisper waits on the network while VAD decodes on a worker thread, so overlap them.
+    transcript_result, silence_result = await asyncio.gather(
+        _transcribe_with_whisper(audio_bytes, segment),
+        run_in_threadpool(_detect_vad_silence, audio_bytes, segment),
+        return_exceptions=True,
+    )
+    if isinstance(transcript_result, BaseException):
+        logger.warning("Whisper transcription failed: %s", transcript_result)
+        transcript_segments = []
+    else:
+        transcript_segments = transcript_result
+    if isinstance(silence_result, BaseException):
+        logger.warning("VAD silence detection failed: %s", silence_result)
+        silence_windows = []
+    else:
+        silence_windows = silence_result
+    return _scene_timing_analysis(expected_plan, transcript_segments, silence_windows)
+
+
+def _scene_timing_analysis(
+    expected_plan: Sequence[SegmentPausePlan],
+    transcript_segments: list[TranscriptSegment],
+    silence_windows: list[SilenceWindow],
+) -> SceneTimingAnalysis:
     segment_reports = _build_segment_reports(expected_plan, transcript_segments, silence_windows)
 
-    return SceneTimingAnalysis(
+    # Every list was validated as it was built, so the container skips a second pass.
+    return SceneTimingAnalysis.model_construct(
         segments=segment_reports,
-        transcript_segments=list(transcript_segments),
-        silence_windows=list(silence_windows),
+        transcript_segments=transcript_segments,
+        silence_windows=silence_windows,
     )